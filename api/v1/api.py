@@ -1,7 +1,7 @@
 from fastapi import APIRouter
 
 # We will create these endpoints next
-from api.v1.endpoints import public_schedule, public_leagues, news
+from api.v1.endpoints import public_schedule, public_leagues, news, status
 
 api_router = APIRouter()
 
@@ -9,3 +9,4 @@ api_router = APIRouter()
 api_router.include_router(public_schedule.router, prefix="/schedule", tags=["schedule"])
 api_router.include_router(news.router, prefix="/news", tags=["news"])
 api_router.include_router(public_leagues.router, prefix="/leagues", tags=["leagues"])
+api_router.include_router(status.router, prefix="/status", tags=["status"])
@@ -1,18 +1,26 @@
 import logging
-from typing import List, Dict, Any
-from fastapi import APIRouter, HTTPException
+from typing import List
+from fastapi import APIRouter, HTTPException, Request
 from datetime import datetime, timedelta
+from functools import partial
 
 from models.news import NewsItem
 from services.niche_service import fetch_niche_news
-from core.config import RSS_FEEDS
+from core.admission import UPSTREAM, AdmissionRejected, check_miss_rate_limit
+from core.cache import cache_namespace
+from core.config import NEWS_CACHE_MAX_BYTES, NEWS_CACHE_TTL_SECONDS, RSS_FEEDS
+from core.logging_config import log_sampled
+from services.refresh_scheduler import get_active_scheduler
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# --- CACHE SETUP (Unchanged) ---
-NEWS_CACHE: Dict[str, Dict[str, Any]] = {}
-CACHE_DURATION = timedelta(minutes=30)
+# --- CACHE SETUP ---
+CACHE_DURATION = timedelta(seconds=NEWS_CACHE_TTL_SECONDS)
+# feed_key -> its newest ARTICLES_PER_SPORT items
+NEWS_CACHE = cache_namespace(
+    "news", ttl=CACHE_DURATION, max_entries=256, max_bytes=NEWS_CACHE_MAX_BYTES
+)
 ARTICLES_PER_SPORT = 10
 
 # --- THIS IS THE NEW, SMARTER LOGIC ---
@@ -20,11 +28,53 @@ CYCLING_LEAGUE_NAMES = {"Cycling - World Tour", "Cycling - Pro Series"}
 # --- END NEW LOGIC ---
 
 
+def _fetch_and_cache_news(feed_key: str) -> List[NewsItem]:
+    """
+    Fetches one feed and caches its newest ARTICLES_PER_SPORT items.
+    Returns the freshly fetched items (empty if the feed gave us nothing,
+    in which case any previously cached items are kept).
+    """
+    # Fetch news from the service (using the feed_key); with a limit, feeds
+    # are only read as far as needed to find the newest items
+    news_items = fetch_niche_news(feed_key, limit=ARTICLES_PER_SPORT)
+
+    # Sort by date
+    news_items.sort(key=lambda x: x.published_date, reverse=True)
+
+    # Apply the 10-article limit
+    top_items = news_items[:ARTICLES_PER_SPORT]
+
+    previous = NEWS_CACHE.peek(feed_key)
+    if not top_items and previous is not None and previous.value:
+        logger.warning(f"News feed {feed_key} returned nothing. Keeping cached items.")
+        return top_items
+
+    # Update the cache with the *limited* list
+    NEWS_CACHE.set(feed_key, top_items)
+    return top_items
+
+
+def refresh_news_feed(feed_key: str) -> None:
+    """Background refresh job. Raises on an empty feed so the scheduler backs off."""
+    if not _fetch_and_cache_news(feed_key):
+        raise RuntimeError(f"No news items fetched for {feed_key}")
+
+
+def seconds_until_news_refresh(feed_key: str, refresh_ahead_factor: float) -> float:
+    """How long until a feed's cached items should be refreshed (0 if due)."""
+    entry = NEWS_CACHE.peek(feed_key)
+    if entry is None:
+        return 0.0
+    refresh_at = entry.stored_at + CACHE_DURATION * refresh_ahead_factor
+    return max((refresh_at - datetime.now()).total_seconds(), 0.0)
+
+
 @router.get("/{league_name}", response_model=List[NewsItem])
-def get_league_news(league_name: str):
+async def get_league_news(league_name: str, request: Request):
     """
     Fetches news feed items for a *specific* league name.
-    Uses a server-side cache.
+    Uses a server-side cache. Cache hits are answered on the event loop;
+    misses are rate limited per client and fetched on the UPSTREAM pool.
     """
 
     # --- THIS IS THE NEW, SMARTER LOGIC ---
@@ -38,34 +88,55 @@ def get_league_news(league_name: str):
 
     # Now, we check for the 'feed_key' in our config
     if feed_key not in RSS_FEEDS:
+        # Crawlers probing random names count against the same budget
+        try:
+            check_miss_rate_limit(request)
+        except AdmissionRejected as e:
+            raise e.to_http_exception()
         raise HTTPException(
             status_code=404, detail=f"No RSS feed configured for: {league_name}"
         )
 
-    now = datetime.now()
-
     # 1. Check the cache (using the feed_key)
-    if feed_key in NEWS_CACHE:
-        cached_data = NEWS_CACHE[feed_key]
-        cache_age = now - cached_data["timestamp"]
-
-        if cache_age < CACHE_DURATION:
-            logger.info(f"News cache HIT for {feed_key}.")
-            return cached_data["items"]
+    cached = NEWS_CACHE.get_entry(feed_key)
+    if cached is not None:
+        if cached.fresh:
+            log_sampled(logger, "news_cache_hit", "News cache HIT for %s.", feed_key)
+            return cached.value
+
+        # The background scheduler owns refreshing; serve stale meanwhile.
+        if get_active_scheduler() is not None:
+            log_sampled(
+                logger,
+                "news_cache_stale",
+                "News cache STALE for %s. Serving cached items.",
+                feed_key,
+            )
+            return cached.value
 
     # 2. CACHE MISS (or stale): Fetch new data
-    logger.info(f"News cache MISS for {feed_key}. Fetching new data...")
-
-    # Fetch news from the service (using the feed_key)
-    news_items = fetch_niche_news(feed_key)
-
-    # Sort by date
-    news_items.sort(key=lambda x: x.published_date, reverse=True)
-
-    # Apply the 10-article limit
-    top_items = news_items[:ARTICLES_PER_SPORT]
-
-    # 3. Update the cache with the *limited* list
-    NEWS_CACHE[feed_key] = {"timestamp": now, "items": top_items}
-
-    return top_items
+    log_sampled(
+        logger,
+        "news_cache_miss",
+        "News cache MISS for %s. Fetching new data...",
+        feed_key,
+    )
+    try:
+        check_miss_rate_limit(request)
+        await UPSTREAM.run(f"news:{feed_key}", partial(_fetch_and_cache_news, feed_key))
+    except AdmissionRejected as e:
+        stale = NEWS_CACHE.peek(feed_key)
+        if stale is not None:
+            log_sampled(
+                logger,
+                "news_refresh_rejected",
+                "News refresh rejected (%s). Serving stale.",
+                e.detail,
+                level=logging.WARNING,
+            )
+            return stale.value
+        raise e.to_http_exception()
+
+    # 3. Return whatever is cached now (new items, or the previous ones)
+    latest = NEWS_CACHE.peek(feed_key)
+    return latest.value if latest is not None else []
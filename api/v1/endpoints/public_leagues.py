@@ -1,6 +1,9 @@
 from typing import List
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from core.config import LEAGUE_ID_MAP
+from models.league import LeagueSummary
+from core.http_cache import cached_json_response
+from api.v1.endpoints.public_schedule import get_league_summary
 
 router = APIRouter()
 
@@ -13,3 +16,14 @@ def get_available_leagues():
     """
     # LEAGUE_ID_MAP should *only* contain your niche sports
     return sorted(list(LEAGUE_ID_MAP.keys()))
+
+
+@router.get("/summary", response_model=List[LeagueSummary])
+async def get_league_summaries(request: Request):
+    """
+    Returns, per league, the number of upcoming events, the next event,
+    when its data was last updated and how its last scrape went.
+    Served from bytes built at refresh time.
+    """
+    body, etag = await get_league_summary(request)
+    return cached_json_response(request, body, etag)
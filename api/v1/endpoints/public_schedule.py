@@ -1,102 +1,928 @@
 import logging
-from typing import List, Dict, Any
-from fastapi import APIRouter
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from typing import Callable, List, Dict, Any, Optional, Tuple
+import pytz
+from pydantic import TypeAdapter
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from datetime import datetime, timedelta, timezone, tzinfo
 
-from models.game import Game as PydanticGame
+from core.admission import (
+    RENDERS,
+    UPSTREAM,
+    AdmissionRejected,
+    check_miss_rate_limit,
+)
+from core.cache import cache_namespace
+from core.config import (
+    LEAGUE_ID_MAP,
+    REFRESH_AHEAD_FACTOR,
+    SCHEDULE_CACHE_TTL_SECONDS,
+    SCHEDULE_CHANGE_HISTORY,
+    SCHEDULE_RENDER_CACHE_MAX_BYTES,
+    SNAPSHOT_PATH,
+    TARGET_TIMEZONE,
+)
+from core.http_cache import (
+    cached_json_response,
+    is_not_modified,
+    iter_chunks,
+    make_etag,
+    validator_headers,
+)
+from core.logging_config import log_sampled
+from models.game import (
+    EventRange,
+    Game as PydanticGame,
+    ScheduleByDay,
+    ScheduleChanges,
+    ScheduleRanges,
+)
+from models.league import LeagueSummary
+from services.archive import get_archive
+from services.changes import diff_entries, entry_hashes, full_reset, schedule_hash
+from services.event_ranges import (
+    ScheduleEntry,
+    expand_entries,
+    expand_range,
+    last_start,
+    next_start,
+    overlapping_entries,
+    window_bounds,
+)
+from services.event_store import EventStore
+from services.encoding import (
+    GAME_FIELDS,
+    RESPONSE_FORMATS,
+    encode_columnar,
+    encode_days,
+    encode_rows,
+    join_array,
+    parse_fields,
+)
+from services.ical import build_calendar
+from services.league_summary import SCRAPER_LEAGUES, build_league_summaries
+from services.localization import get_timezone, localize_games
+from services.refresh_scheduler import get_active_scheduler
+from services.search_index import EventSearchIndex
+from services.snapshot import load_snapshot, save_snapshot, snapshot_lock
 
 # Import the scraping functions
 from services.niche_service import (
     _get_cycling_schedule,
     _scrape_diamond_league_from_wikipedia,
     _get_climbing_schedule,
+    backfill_past_seasons,
 )
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
-# --- CACHE SETUP (Unchanged) ---
-SCHEDULE_CACHE: Dict[str, Any] = {}
-CACHE_DURATION = timedelta(hours=4)
+# --- CACHE SETUP ---
+CACHE_DURATION = timedelta(seconds=SCHEDULE_CACHE_TTL_SECONDS)
+# One entry: the current schedule and everything derived from it at refresh
+SCHEDULE_CACHE = cache_namespace("schedule", ttl=CACHE_DURATION, max_entries=1)
+SCHEDULE_KEY = "current"
+# Everything expanded into per-day games, built lazily: per-timezone
+# renderings, projected / columnar encodings, windows, change sets, the
+# ranges view and calendar feeds. Keyed by schedule version, so they stay
+# valid until the content changes.
+SCHEDULE_RENDERS = cache_namespace(
+    "schedule_renders", max_entries=128, max_bytes=SCHEDULE_RENDER_CACHE_MAX_BYTES
+)
 # --- END CACHE SETUP ---
 
+# scraper name -> {"status", "last_attempt", "last_success", "error"}
+SCRAPE_STATUS: Dict[str, Dict[str, Any]] = {}
+
+# The ".ics" feed that contains every league
+ICS_ALL_FEED = "all"
+# feed id -> (ETag, Last-Modified) of its latest rendering, so a feed keeps
+# its Last-Modified across schedule versions that didn't change its events
+_ICS_LAST_MODIFIED: Dict[str, Tuple[str, datetime]] = {}
+
+_LEAGUE_SUMMARY_ADAPTER = TypeAdapter(List[LeagueSummary])
+
+
+def _current_schedule() -> Optional[Dict[str, Any]]:
+    """The cached schedule state, fresh or not (None before the first load)."""
+    entry = SCHEDULE_CACHE.peek(SCHEDULE_KEY)
+    return entry.value if entry is not None else None
+
+
+def _ics_feed_names() -> Dict[str, str]:
+    """feed id -> calendar name, for every league plus the all-leagues feed."""
+    names = {ICS_ALL_FEED: "All Sports"}
+    for league_name, league_info in LEAGUE_ID_MAP.items():
+        names[league_info["id"]] = league_name
+    return names
+
+
+def _build_ics_feed(schedule: Dict[str, Any], feed_id: str) -> Dict[str, Any]:
+    """
+    Renders one iCalendar document, for a league or for all of them. Only
+    that feed's entries are expanded. A feed whose events did not change
+    keeps its ETag and Last-Modified, so polling calendar clients keep
+    getting 304s.
+    """
+    feed_name = _ics_feed_names()[feed_id]
+    entries = schedule["entries"]
+    if feed_id != ICS_ALL_FEED:
+        entries = [e for e in entries if e.league == feed_name]
+    games = expand_entries(entries, start=schedule["not_before"])
+
+    # The ETag covers the events, not DTSTAMP, so it only changes with content.
+    content_key = "\n".join(g.model_dump_json() for g in games)
+    etag = make_etag(content_key.encode("utf-8"))
+    previous = _ICS_LAST_MODIFIED.get(feed_id)
+    if previous is not None and previous[0] == etag:
+        last_modified = previous[1]
+    else:
+        last_modified = datetime.now(timezone.utc)
+        _ICS_LAST_MODIFIED[feed_id] = (etag, last_modified)
+
+    return {
+        "etag": etag,
+        "last_modified": last_modified,
+        "body": build_calendar(games, f"The Aggregate - {feed_name}", last_modified),
+    }
+
+
+class ScheduleRefreshFailed(RuntimeError):
+    """No scraper produced anything usable; the cached schedule was kept."""
 
-def _fetch_and_cache_schedule() -> List[PydanticGame]:
+
+def _previous_entries(source: str) -> List[ScheduleEntry]:
+    """The current schedule's entries from `source`'s scraper, not yet over."""
+    leagues = set(SCRAPER_LEAGUES[source])
+    now = datetime.now(timezone.utc)
+    current = _current_schedule() or {}
+    return [
+        e
+        for e in current.get("entries", [])
+        if e.league in leagues
+        and (e.end_time if isinstance(e, EventRange) else e.start_time) >= now
+    ]
+
+
+def _fetch_and_cache_schedule() -> List[ScheduleEntry]:
+    """
+    Refreshes the schedule and returns its entries. Under serve.py every
+    worker runs this (on its timer or on a miss), so the workers take
+    turns on the snapshot lock: the first scrapes and saves, and those
+    waiting behind it load what it saved instead of scraping again. The
+    lock is also what keeps versions in order: a scrape numbers its
+    schedule after the version last saved, by any worker.
+    """
+    with snapshot_lock(SNAPSHOT_PATH):
+        snapshot = load_snapshot(SNAPSHOT_PATH)
+        if snapshot is not None and _is_newer_snapshot(snapshot[0]):
+            state = _restore_snapshot(snapshot)
+            logger.info(
+                f"Loaded schedule v{state['version']} from a snapshot saved by "
+                f"another worker at {snapshot[0]}."
+            )
+            return state["entries"]
+        saved = (snapshot[2], snapshot[3]) if snapshot is not None else None
+        return _scrape_and_cache_schedule(saved)
+
+
+def _scrape_and_cache_schedule(
+    saved: Optional[Tuple[int, str]] = None,
+) -> List[ScheduleEntry]:
     """
     This is the "slow" function that runs on a cache miss.
     It now runs each scraper independently so one failure
     doesn't break the whole schedule.
+
+    A source that fails or comes back empty keeps its entries from the
+    current schedule, so an upstream outage doesn't wipe its events.
+    Raises ScheduleRefreshFailed (leaving the cache and snapshot alone)
+    when every scraper failed, or when nothing at all was scraped but a
+    schedule is already cached.
+
+    `saved` is the (version, content hash) of the snapshot on disk; the
+    caller must hold the snapshot lock.
     """
     logger.info("--- CACHE MISS ---")
     logger.info("Running all niche scrapers to build new cache...")
 
     now = datetime.now()
-    all_upcoming_games = []
+    # Single events, plus multi-day races as one EventRange each
+    all_upcoming_entries: List[ScheduleEntry] = []
+    failed = 0
 
-    # --- THIS IS THE SMARTER LOGIC ---
+    # (source as in SCRAPER_LEAGUES, scraper, what it returns, for the logs)
+    scrapers = (
+        ("cycling", _get_cycling_schedule, "cycling races"),
+        ("diamond_league", _scrape_diamond_league_from_wikipedia, "track events"),
+        ("climbing", _get_climbing_schedule, "climbing events"),
+    )
+    for source, scraper, what in scrapers:
+        scraped: List[ScheduleEntry] = []
+        try:
+            scraped = scraper()
+            _record_scrape(source, scraped)
+        except Exception as e:
+            logger.error(f"SCRAPER FAILED: {source} scraper failed. Error: {e}")
+            _record_scrape(source, error=e)
+            failed += 1
 
-    # 1. Try to get Cycling
-    try:
-        scraped_games_cycling = _get_cycling_schedule()
-        if scraped_games_cycling:
-            all_upcoming_games.extend(scraped_games_cycling)
-            logger.info(
-                f"Successfully scraped {len(scraped_games_cycling)} cycling events."
+        if scraped:
+            all_upcoming_entries.extend(scraped)
+            logger.info(f"Successfully scraped {len(scraped)} {what}.")
+            continue
+        kept = _previous_entries(source)
+        if kept:
+            logger.warning(
+                f"No {what} scraped; keeping {len(kept)} from the current schedule."
             )
-    except Exception as e:
-        logger.error(f"SCRAPER FAILED: Cycling scraper failed. Error: {e}")
+            all_upcoming_entries.extend(kept)
 
-    # 2. Try to get Track & Field
+    if failed == len(scrapers):
+        raise ScheduleRefreshFailed("Every schedule scraper failed.")
+
+    # Archive finished seasons we have never scraped (runs once per season)
     try:
-        scraped_games_athletics = _scrape_diamond_league_from_wikipedia()
-        if scraped_games_athletics:
-            all_upcoming_games.extend(scraped_games_athletics)
-            logger.info(
-                f"Successfully scraped {len(scraped_games_athletics)} track events."
-            )
+        backfill_past_seasons()
     except Exception as e:
-        logger.error(f"SCRAPER FAILED: Track scraper failed. Error: {e}")
+        logger.error(f"ARCHIVE: Season backfill failed. Error: {e}")
+
+    if not all_upcoming_entries and schedule_loaded():
+        raise ScheduleRefreshFailed("No events scraped; kept the current schedule.")
+
+    # Sort the final list (of successfully scraped events)
+    all_upcoming_entries.sort(key=lambda x: x.start_time)
+
+    state = _update_schedule_cache(all_upcoming_entries, now, saved=saved)
+    if all_upcoming_entries:
+        save_snapshot(
+            SNAPSHOT_PATH,
+            now,
+            all_upcoming_entries,
+            state["version"],
+            state["content_hash"],
+        )
+
+    logger.info(
+        f"Scrape complete. Found {len(all_upcoming_entries)} events and ranges "
+        f"(schedule v{state['version']})."
+    )
+    return state["entries"]
+
+
+def _record_scrape(
+    source: str,
+    games: Optional[List[ScheduleEntry]] = None,
+    error: Optional[Exception] = None,
+) -> None:
+    """Notes how a scraper's last run went, for /leagues/summary."""
+    now = datetime.now()
+    status = SCRAPE_STATUS.setdefault(source, {"last_success": None})
+    status["last_attempt"] = now
+    if error is not None:
+        status.update(status="failed", error=f"{type(error).__name__}: {error}")
+    elif not games:
+        status.update(status="empty", error=None)
+    else:
+        status.update(status="ok", error=None, last_success=now)
+
+    # The cached summary shows the old status. A successful refresh swaps
+    # in a new one anyway, but a failed one keeps this schedule, so drop
+    # the summary and let get_league_summary rebuild it.
+    current = _current_schedule()
+    if current is not None:
+        current["league_summary"] = None
+
+
+def _build_league_summary(
+    entries: List[ScheduleEntry], timestamp: datetime
+) -> Dict[str, Any]:
+    summaries, valid_until = build_league_summaries(entries, SCRAPE_STATUS, timestamp)
+    body = _LEAGUE_SUMMARY_ADAPTER.dump_json(summaries)
+    return {"body": body, "etag": make_etag(body), "valid_until": valid_until}
+
+
+async def _get_changes(
+    request: Request, schedule: Dict[str, Any], since: int
+) -> Tuple[bytes, str]:
+    """
+    The (body, etag) of the changes from version `since` to the current
+    one, or of a full reset if `since` is no longer in the history. Built
+    on first request, from the changed entries only, then cached.
+    """
+    history, version = schedule["versions"], schedule["version"]
+    if since not in history:
+        since = None
+
+    def build() -> Tuple[bytes, str]:
+        if since is None:
+            games = expand_entries(schedule["entries"], start=schedule["not_before"])
+            changes = full_reset(version, games)
+        else:
+            changes = diff_entries(
+                since,
+                history[since],
+                version,
+                schedule["entries"],
+                history[version],
+                schedule["not_before"],
+            )
+        body = changes.model_dump_json().encode("utf-8")
+        return body, make_etag(body)
+
+    return await _cached_render(request, ("changes", version, since), build, _body_size)
+
+
+def _serialize_ranges(
+    version: int, entries: List[ScheduleEntry], upcoming_from: Optional[datetime]
+) -> Tuple[bytes, str]:
+    """
+    The /ranges body: the events that have not started, and the ranges
+    with a day that has not (None: nothing is upcoming).
+    """
+    if upcoming_from is None:
+        entries = []
+    ranges = ScheduleRanges(
+        version=version,
+        events=[
+            e
+            for e in entries
+            if isinstance(e, PydanticGame) and e.start_time >= upcoming_from
+        ],
+        ranges=[
+            e
+            for e in entries
+            if isinstance(e, EventRange) and e.end_time >= upcoming_from
+        ],
+    )
+    body = ranges.model_dump_json().encode("utf-8")
+    return body, make_etag(body)
+
+
+def _update_schedule_cache(
+    entries: List[ScheduleEntry],
+    timestamp: datetime,
+    version: Optional[int] = None,
+    saved: Optional[Tuple[int, str]] = None,
+) -> Dict[str, Any]:
+    """
+    Swaps in a new schedule and rebuilds everything derived from it.
+    The new state is built first and swapped in with one set(), so
+    concurrent readers never see new entries with an old index.
+
+    `entries` are single events and multi-day EventRanges, and the state
+    keeps them that way: a range is expanded into its days only where a
+    response needs them (a rendering, a window, a search hit, one event),
+    and only for those days.
+
+    The schedule version only goes up, and only when some game's content
+    changed. Pass `version` to restore a saved one (e.g. from the
+    snapshot). Otherwise the content is compared with `saved`, the
+    (version, content hash) in the snapshot, or with the current schedule
+    if there is none: the same content keeps its version, and new content
+    gets the next one after both.
+    """
+    # Race days that had started when the schedule was scraped are dropped,
+    # like past single events. Using the scrape time (not now) means a
+    # snapshot expands to the same games it was saved with.
+    not_before = timestamp.astimezone(timezone.utc)
+
+    # Unchanged entries keep their objects and serialized bytes
+    current = _current_schedule() or {}
+    events = current.get("events", EventStore()).upsert(entries)
+    entries = sorted(events.entries, key=lambda entry: entry.start_time)
+    hashes = entry_hashes(entries, events.hashes, not_before)
+    content_hash = schedule_hash(hashes)
+    history = OrderedDict(current.get("versions", {}))
+    if version is None:
+        # Compare with the last saved schedule, or with ours if none was saved
+        base_version, base_hash = saved or (
+            current.get("version", 0),
+            current.get("content_hash"),
+        )
+        version = base_version
+        if content_hash != base_hash:
+            version = max(base_version, current.get("version", 0)) + 1
+    # Version 0 means "no schedule yet" (see full_reset), so never reuse it
+    version = max(version, 1)
+    history[version] = hashes
+    history.move_to_end(version)
+    while len(history) > SCHEDULE_CHANGE_HISTORY:
+        history.popitem(last=False)
+
+    new_state = {
+        "events": events,
+        # Sorted by start time; also what a failing source falls back on
+        "entries": entries,
+        # For finding the entries with a day in a window (overlapping_entries)
+        "entry_starts": [entry.start_time for entry in entries],
+        "max_span": max(
+            (last_start(entry) - entry.start_time for entry in entries),
+            default=timedelta(0),
+        ),
+        "not_before": not_before,
+        "version": version,
+        # Tells the next refresh whether the content changed
+        "content_hash": content_hash,
+        # version -> EntryHashes; /changes diffs against these on demand
+        "versions": history,
+        # Per-league counts / next event / scrape status, served as bytes
+        "league_summary": _build_league_summary(entries, timestamp),
+        "timestamp": timestamp,
+        # Games starting before this have started (see _upcoming_from)
+        "upcoming_from": not_before,
+        # Rebuild the search index once per refresh, not once per request
+        "search_index": EventSearchIndex(entries),
+    }
+    # Expires relative to when the data was scraped (older for a snapshot)
+    SCHEDULE_CACHE.set(SCHEDULE_KEY, new_state, stored_at=timestamp)
+    return new_state
+
+
+def schedule_loaded() -> bool:
+    """True once a schedule (scraped or from the snapshot) is in the cache."""
+    return _current_schedule() is not None
+
+
+def load_schedule_snapshot() -> bool:
+    """
+    Fills the cache from the snapshot on disk (called at startup).
+    Returns True if a snapshot was loaded.
+    """
+    snapshot = load_snapshot(SNAPSHOT_PATH)
+    if snapshot is None:
+        return False
+    state = _restore_snapshot(snapshot)
+    logger.info(
+        f"Loaded schedule snapshot v{state['version']} with {len(state['entries'])} "
+        f"events and ranges from {snapshot[0]}."
+    )
+    return True
+
+
+def _restore_snapshot(
+    snapshot: Tuple[datetime, List[ScheduleEntry], int, str],
+) -> Dict[str, Any]:
+    timestamp, entries, version, _ = snapshot
+    return _update_schedule_cache(entries, timestamp, version)
+
+
+def _is_newer_snapshot(timestamp: datetime) -> bool:
+    """
+    True if a snapshot saved at `timestamp` was saved (by another process)
+    after our schedule was scraped, and is not due for a refresh itself.
+    """
+    current = _current_schedule()
+    if current is not None and timestamp <= current["timestamp"]:
+        return False
+    return datetime.now() - timestamp < CACHE_DURATION * REFRESH_AHEAD_FACTOR
+
+
+async def _ensure_fresh_schedule(request: Request) -> Dict[str, Any]:
+    """
+    Returns the schedule cache, re-scraping first if it is missing or stale.
+    Cache hits are answered on the event loop; a scrape runs on the bounded
+    UPSTREAM pool, shared by every request that misses at the same time.
+    """
+    cached = SCHEDULE_CACHE.get_entry(SCHEDULE_KEY)
+    if cached is not None:
+        if cached.fresh:
+            log_sampled(logger, "schedule_cache_hit", "Schedule cache HIT.")
+            return cached.value
+
+        # The background scheduler owns refreshing; never make a request wait.
+        if get_active_scheduler() is not None:
+            log_sampled(
+                logger,
+                "schedule_cache_stale",
+                "Schedule cache STALE. Serving it until the refresh lands.",
+            )
+            return cached.value
 
-    # 3. Try to get Climbing
     try:
-        scraped_games_climbing = _get_climbing_schedule()
-        if scraped_games_climbing:
-            all_upcoming_games.extend(scraped_games_climbing)
-            logger.info(
-                f"Successfully scraped {len(scraped_games_climbing)} climbing events."
+        check_miss_rate_limit(request)
+        await UPSTREAM.run("schedule", _fetch_and_cache_schedule)
+    except ScheduleRefreshFailed as e:
+        stale = _current_schedule()
+        if stale is None:
+            raise HTTPException(status_code=503, detail=str(e))
+        logger.warning(f"Schedule refresh failed ({e}). Serving stale.")
+        return stale
+    except AdmissionRejected as e:
+        stale = _current_schedule()
+        if stale is not None:
+            log_sampled(
+                logger,
+                "schedule_refresh_rejected",
+                "Schedule refresh rejected (%s). Serving stale.",
+                e.detail,
+                level=logging.WARNING,
             )
-    except Exception as e:
-        logger.error(f"SCRAPER FAILED: Climbing scraper failed. Error: {e}")
+            return stale
+        raise e.to_http_exception()
+    return _current_schedule()
 
-    # --- END SMARTER LOGIC ---
 
-    # Sort the final list (of successfully scraped events)
-    all_upcoming_games.sort(key=lambda x: x.start_time)
+def refresh_schedule() -> None:
+    """Background refresh job (see RefreshScheduler)."""
+    _fetch_and_cache_schedule()
+
+
+def _upcoming_from(schedule: Dict[str, Any]) -> Optional[datetime]:
+    """
+    Returns the start time of the next game to start (None if there is
+    none left). Exactly the games starting at or after it are upcoming,
+    so it keys every rendering of the upcoming schedule: started games
+    stop being served without a re-scrape. It only moves when a game
+    starts, and is then found again from the entries, never the games.
+    """
+    upcoming_from = schedule["upcoming_from"]
+    now = datetime.now(timezone.utc)
+    if upcoming_from is not None and upcoming_from < now:
+        upcoming_from = min(
+            filter(None, (next_start(entry, now) for entry in schedule["entries"])),
+            default=None,
+        )
+        schedule["upcoming_from"] = upcoming_from
+    return upcoming_from
+
+
+def seconds_until_schedule_refresh(refresh_ahead_factor: float) -> float:
+    """How long until the cached schedule should be refreshed (0 if it is due)."""
+    entry = SCHEDULE_CACHE.peek(SCHEDULE_KEY)
+    if entry is None:
+        return 0.0
+    refresh_at = entry.stored_at + CACHE_DURATION * refresh_ahead_factor
+    return max((refresh_at - datetime.now()).total_seconds(), 0.0)
+
+
+def _body_size(encoded: Tuple[bytes, str]) -> int:
+    return len(encoded[0])
+
+
+async def _cached_render(
+    request: Request,
+    key: Tuple[Any, ...],
+    build: Callable[[], Any],
+    size: Optional[Callable[[Any], int]] = None,
+) -> Any:
+    """
+    Returns SCHEDULE_RENDERS[key], calling `build` to make it on a miss.
+    A build costs time in proportion to the schedule, so it runs on the
+    RENDERS pool instead of the event loop, and it counts against the
+    caller's miss budget like a scrape does. A client cycling through
+    every valid timezone can't stall the requests being answered from
+    cache. Concurrent misses for one key share one build.
+    """
+    cached = SCHEDULE_RENDERS.get(key)
+    if cached is not None:
+        return cached
+
+    def build_and_store() -> Any:
+        value = build()
+        SCHEDULE_RENDERS.set(key, value, size=size(value) if size else None)
+        return value
+
+    try:
+        check_miss_rate_limit(request)
+        return await RENDERS.run(repr(key), build_and_store)
+    except AdmissionRejected as e:
+        raise e.to_http_exception()
+
+
+def _resolve_timezone(tz_name: Optional[str]) -> tzinfo:
+    try:
+        return get_timezone(tz_name or TARGET_TIMEZONE.zone)
+    except pytz.UnknownTimeZoneError:
+        raise HTTPException(status_code=400, detail=f"Unknown timezone: {tz_name}")
+
+
+async def _get_localized_schedule(
+    request: Request, tz_name: Optional[str]
+) -> Tuple[Dict[str, Any], int]:
+    """
+    Returns (rendered, first): the schedule localized to `tz_name`
+    (default: TARGET_TIMEZONE) and serialized, and the index of its first
+    game that has not started. Each zone is rendered once per schedule
+    version and then shared by every client in that zone.
+    """
+    schedule = await _ensure_fresh_schedule(request)
+    tz = _resolve_timezone(tz_name)
+
+    def build() -> Dict[str, Any]:
+        localized_games = localize_games(
+            expand_entries(schedule["entries"], start=schedule["not_before"]), tz
+        )
+        return {
+            "version": schedule["version"],
+            "timezone": tz.zone,
+            "games": localized_games,
+            # The games' start times, for finding the first upcoming one
+            "start_times": [game.start_time for game in localized_games],
+            "fragments": [g.model_dump_json().encode("utf-8") for g in localized_games],
+        }
+
+    key = ("localized", schedule["version"], tz.zone)
+    rendered = await _cached_render(request, key, build)
+
+    upcoming_from = _upcoming_from(schedule)
+    if upcoming_from is None:
+        return rendered, len(rendered["games"])
+    return rendered, window_bounds(rendered["start_times"], upcoming_from)[0]
+
+
+async def _get_upcoming_bodies(
+    request: Request, tz_name: Optional[str]
+) -> Dict[str, Tuple[bytes, str]]:
+    """
+    Returns the list and by-day bodies of the upcoming games, as (body,
+    etag). They are joined from the rendering's per-game fragments, so
+    when a game starts they are re-joined without it: nothing is
+    re-scraped or re-serialized.
+    """
+    rendered, first = await _get_localized_schedule(request, tz_name)
+
+    def build() -> Dict[str, Tuple[bytes, str]]:
+        games, fragments = rendered["games"][first:], rendered["fragments"][first:]
+        list_body = join_array(fragments)
+        days_body = encode_days(rendered["timezone"], games, fragments)
+        return {
+            "list": (list_body, make_etag(list_body)),
+            "days": (days_body, make_etag(days_body)),
+        }
+
+    key = ("upcoming", rendered["version"], rendered["timezone"], first)
+    return await _cached_render(
+        request,
+        key,
+        build,
+        lambda bodies: sum(len(body) for body, _ in bodies.values()),
+    )
+
+
+async def get_league_summary(request: Request) -> Tuple[bytes, str]:
+    """
+    Returns the league summary's (body, etag). It is rebuilt when the
+    schedule is refreshed, when a scraper's status changes, or when a
+    league's next event has started.
+    """
+    schedule = await _ensure_fresh_schedule(request)
+    summary = schedule["league_summary"]
+    if summary is None or (
+        summary["valid_until"] is not None
+        and datetime.now(timezone.utc) >= summary["valid_until"]
+    ):
+        summary = _build_league_summary(schedule["entries"], schedule["timestamp"])
+        schedule["league_summary"] = summary
+    return summary["body"], summary["etag"]
 
-    logger.info(f"Scrape complete. Found {len(all_upcoming_games)} total games.")
 
-    # Update the cache
-    SCHEDULE_CACHE["timestamp"] = now
-    SCHEDULE_CACHE["items"] = all_upcoming_games
+async def _get_encoded_schedule(
+    request: Request, tz_name: Optional[str], fields: Tuple[str, ...], fmt: str
+) -> Tuple[bytes, str]:
+    """Returns (body, etag) for a field projection / format, encoded once per version."""
+    if fmt == "json" and fields == GAME_FIELDS:
+        return (await _get_upcoming_bodies(request, tz_name))["list"]
 
-    return all_upcoming_games
+    rendered, first = await _get_localized_schedule(request, tz_name)
+
+    def build() -> Tuple[bytes, str]:
+        encode = encode_columnar if fmt == "columnar" else encode_rows
+        body = encode(rendered["games"][first:], fields)
+        return body, make_etag(body)
+
+    key = ("encoded", rendered["version"], rendered["timezone"], fields, fmt, first)
+    return await _cached_render(request, key, build, _body_size)
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Query datetimes without an offset are taken to be UTC."""
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=timezone.utc)
+
+
+async def _get_window_schedule(
+    request: Request,
+    tz_name: Optional[str],
+    fields: Tuple[str, ...],
+    fmt: str,
+    start: Optional[datetime],
+    end: Optional[datetime],
+) -> Tuple[bytes, str]:
+    """
+    Returns (body, etag) for just the games starting in [start, end).
+    Only the entries with a day in the window are expanded, and only for
+    those days, so a client showing one week never pays for the whole
+    season.
+    """
+    schedule = await _ensure_fresh_schedule(request)
+    tz = _resolve_timezone(tz_name)
+    start, end = _as_utc(start), _as_utc(end)
+
+    # Games that have started are never in a window
+    upcoming_from = _upcoming_from(schedule)
+    if upcoming_from is None:
+        start = end = None
+    elif start is None or start < upcoming_from:
+        start = upcoming_from
+
+    def build() -> Tuple[bytes, str]:
+        games = []
+        if start is not None:
+            entries = overlapping_entries(
+                schedule["entries"],
+                schedule["entry_starts"],
+                schedule["max_span"],
+                start,
+                end,
+            )
+            games = localize_games(expand_entries(entries, start, end), tz)
+        encode = encode_columnar if fmt == "columnar" else encode_rows
+        body = encode(games, fields)
+        return body, make_etag(body)
+
+    key = ("window", schedule["version"], tz.zone, fields, fmt, start, end)
+    return await _cached_render(request, key, build, _body_size)
 
 
 @router.get("/", response_model=List[PydanticGame])
-def get_public_schedule():
+async def get_public_schedule(
+    request: Request,
+    tz: Optional[str] = None,
+    fields: Optional[str] = Query(
+        None, description="Comma-separated Game fields to include (default: all)"
+    ),
+    response_format: str = Query(
+        "json",
+        alias="format",
+        description="'json' (list of objects) or 'columnar' (per-column arrays)",
+    ),
+    start: Optional[datetime] = Query(
+        None, description="Only events starting at or after this time"
+    ),
+    end: Optional[datetime] = Query(None, description="Only events starting before"),
+):
     """
     Returns a list of all upcoming niche sport events.
     Uses a 4-hour in-memory cache to avoid slow scrapes.
+    `start_time_local` is filled in for the `tz` timezone (IANA name).
+    With `start` / `end`, only the events (and race days) in that window
+    are returned.
     """
-    now = datetime.now()
+    if response_format not in RESPONSE_FORMATS:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown format: {response_format}"
+        )
+    try:
+        projected_fields = parse_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if start is not None or end is not None:
+        body, etag = await _get_window_schedule(
+            request, tz, projected_fields, response_format, start, end
+        )
+    else:
+        body, etag = await _get_encoded_schedule(
+            request, tz, projected_fields, response_format
+        )
+    return cached_json_response(request, body, etag)
+
+
+@router.get("/days", response_model=ScheduleByDay)
+async def get_public_schedule_by_day(request: Request, tz: Optional[str] = None):
+    """Returns all upcoming events grouped by local date in the `tz` timezone."""
+    body, etag = (await _get_upcoming_bodies(request, tz))["days"]
+    return cached_json_response(request, body, etag)
+
+
+@router.get("/ranges", response_model=ScheduleRanges)
+async def get_schedule_ranges(request: Request):
+    """
+    Returns the upcoming schedule with each multi-day race sent once, as a
+    range (first / last day and stage count) instead of one event per day.
+    Day N of a range starts N-1 days after its start_time.
+    """
+    schedule = await _ensure_fresh_schedule(request)
+    upcoming_from = _upcoming_from(schedule)
+    body, etag = await _cached_render(
+        request,
+        ("ranges", schedule["version"], upcoming_from),
+        lambda: _serialize_ranges(
+            schedule["version"], schedule["entries"], upcoming_from
+        ),
+        _body_size,
+    )
+    return cached_json_response(request, body, etag)
+
+
+@router.get("/search", response_model=List[PydanticGame])
+async def search_public_schedule(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+):
+    """
+    Autocomplete search over event names and venues.
+    Matches word prefixes and tolerates small typos.
+    """
+    schedule = await _ensure_fresh_schedule(request)
+    upcoming_from = _upcoming_from(schedule)
+    if upcoming_from is None:
+        return []
+    index = schedule["search_index"]
+    # Searches are CPU work: run them on the bounded RENDERS pool, where
+    # identical queries in flight share one run and a flood is shed
+    key = ("search", schedule["version"], q, limit, upcoming_from)
+    try:
+        return await RENDERS.run(
+            repr(key), lambda: index.search(q, limit=limit, not_before=upcoming_from)
+        )
+    except AdmissionRejected as e:
+        raise e.to_http_exception()
+
+
+@router.get("/changes", response_model=ScheduleChanges)
+async def get_schedule_changes(
+    request: Request,
+    since: int = Query(..., ge=0, description="The schedule version you have"),
+):
+    """
+    Returns the games added, modified and removed since version `since`.
+    Start with since=0 to get the full schedule and the current version.
+    If `since` is too old to diff against, `reset` is true and `added`
+    holds the whole schedule.
+    """
+    schedule = await _ensure_fresh_schedule(request)
+    body, etag = await _get_changes(request, schedule, since)
+    return cached_json_response(request, body, etag)
+
+
+@router.get("/history", response_model=List[PydanticGame])
+def get_schedule_history(
+    league: Optional[str] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+):
+    """
+    Returns archived events (past and upcoming) in the [start, end) range.
+    Answered from the archive's index; never triggers a scrape.
+    """
+    if league is not None and league not in LEAGUE_ID_MAP:
+        raise HTTPException(status_code=404, detail=f"Unknown league: {league}")
+    return get_archive().query(
+        league=league, start=start, end=end, limit=limit, offset=offset
+    )
+
+
+@router.get("/{feed}.ics")
+async def get_schedule_ics(feed: str, request: Request):
+    """
+    Returns an iCalendar feed for one league (by its id, e.g. 'pcs_world.ics')
+    or for every league ('all.ics'). Rendered once per schedule version.
+    """
+    schedule = await _ensure_fresh_schedule(request)
+    if feed not in _ics_feed_names():
+        raise HTTPException(status_code=404, detail=f"No calendar feed for: {feed}")
+    cached_feed = await _cached_render(
+        request,
+        ("ics", schedule["version"], feed),
+        lambda: _build_ics_feed(schedule, feed),
+        lambda built: len(built["body"]),
+    )
+
+    headers = validator_headers(cached_feed["etag"], cached_feed["last_modified"])
+    headers["Cache-Control"] = "public, max-age=900"
+
+    if is_not_modified(request, cached_feed["etag"], cached_feed["last_modified"]):
+        return Response(status_code=304, headers=headers)
+
+    return StreamingResponse(
+        iter_chunks(cached_feed["body"]),
+        media_type="text/calendar; charset=utf-8",
+        headers=headers,
+    )
 
-    # 1. Check the cache (Unchanged)
-    if "timestamp" in SCHEDULE_CACHE:
-        cache_age = now - SCHEDULE_CACHE["timestamp"]
 
-        if cache_age < CACHE_DURATION:
-            logger.info("Schedule cache HIT. Returning cached data.")
-            return SCHEDULE_CACHE["items"]
+# Declared last: it would otherwise shadow the fixed paths above
+@router.get("/{game_id}", response_model=PydanticGame)
+async def get_schedule_event(game_id: str, request: Request):
+    """Returns one upcoming event by its game_id."""
+    schedule = await _ensure_fresh_schedule(request)
+    events = schedule["events"]
+    if isinstance(events.get(game_id), PydanticGame):
+        body, etag = events.get_json(game_id)
+        return cached_json_response(request, body, etag)
 
-    # 2. Cache MISS (or stale): Fetch new data (Unchanged)
-    return _fetch_and_cache_schedule()
+    # A day of a multi-day race: '{id_prefix}_{day of month}'
+    event_range = events.get(game_id.rpartition("_")[0])
+    if isinstance(event_range, EventRange):
+        for game in expand_range(event_range, start=schedule["not_before"]):
+            if game.game_id == game_id:
+                body = game.model_dump_json().encode("utf-8")
+                return cached_json_response(request, body, make_etag(body))
+    raise HTTPException(status_code=404, detail=f"No event with id: {game_id}")
@@ -0,0 +1,26 @@
+from typing import Any, Dict, List
+from fastapi import APIRouter
+
+from core.cache import cache_stats
+from services.refresh_scheduler import get_active_scheduler
+
+router = APIRouter()
+
+
+@router.get("/refresh", response_model=List[Dict[str, Any]])
+def get_refresh_status():
+    """
+    Returns the background refresh scheduler's next-run table.
+    (Empty if background refresh is disabled in this process.)
+    """
+    scheduler = get_active_scheduler()
+    return scheduler.status() if scheduler else []
+
+
+@router.get("/cache", response_model=List[Dict[str, Any]])
+def get_cache_status():
+    """
+    Returns per-namespace cache statistics: entries and estimated bytes
+    against their bounds, TTL, hits / stale hits / misses and evictions.
+    """
+    return cache_stats()
@@ -0,0 +1,188 @@
+"""
+Cold-start budget check for the API.
+
+Each run starts a fresh interpreter, imports `main`, runs the app lifespan
+(which loads a warm schedule snapshot) and sends `/` and `/api/v1/schedule/`
+straight to the ASGI app. It reports import time, time to each first
+response, and which scraping dependencies got imported along the way.
+
+The script exits non-zero if the median run is over budget, or if a scraping
+dependency was imported just to serve cached data:
+
+    python benchmarks/cold_start.py --runs 5 --import-budget-ms 600
+"""
+
+import argparse
+import datetime as dt
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# These must only be imported once we actually scrape.
+LAZY_MODULES = ("bs4", "lxml", "feedparser", "requests")
+
+CHILD_SCRIPT = r"""
+import time
+t0 = time.perf_counter()
+import asyncio, json, sys
+
+import main
+
+t_import = time.perf_counter()
+
+
+async def asgi_get(app, path):
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": path,
+        "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 0), "server": ("localhost", 80),
+    }
+    result = {}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            result["status"] = message["status"]
+
+    await app(scope, receive, send)
+    return result["status"]
+
+
+async def run():
+    async with main.app.router.lifespan_context(main.app):
+        t_ready = time.perf_counter()
+        root_status = await asgi_get(main.app, "/")
+        t_root = time.perf_counter()
+        schedule_status = await asgi_get(main.app, "/api/v1/schedule/")
+        t_schedule = time.perf_counter()
+    return {
+        "import_ms": (t_import - t0) * 1000,
+        "startup_ms": (t_ready - t0) * 1000,
+        "first_root_ms": (t_root - t0) * 1000,
+        "first_schedule_ms": (t_schedule - t0) * 1000,
+        "root_status": root_status,
+        "schedule_status": schedule_status,
+        "lazy_modules_loaded": [m for m in LAZY_MODULES if m in sys.modules],
+    }
+
+
+LAZY_MODULES = %(lazy_modules)r
+print("RESULT " + json.dumps(asyncio.run(run())))
+"""
+
+
+def _write_warm_snapshot(path: str, n_games: int) -> None:
+    now = dt.datetime.now(dt.timezone.utc)
+    items = [
+        {
+            "game_id": f"BENCH_{i}",
+            "league": "Cycling - World Tour",
+            "start_time": (now + dt.timedelta(hours=6 * i)).isoformat(),
+            "status": "Scheduled",
+            "home_team": f"Benchmark Race {i // 5} - Stage {i % 5 + 1}",
+            "venue": "UCI 2.UWT",
+            "official_url": "https://www.procyclingstats.com/race/benchmark",
+        }
+        for i in range(n_games)
+    ]
+    with open(path, "w") as f:
+        json.dump({"timestamp": dt.datetime.now().isoformat(), "items": items}, f)
+
+
+def _run_once(env: dict) -> dict:
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT % {"lazy_modules": LAZY_MODULES}],
+        cwd=REPO_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    wall_ms = (time.perf_counter() - started) * 1000
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith("RESULT "):
+            result = json.loads(line[len("RESULT ") :])
+            result["process_wall_ms"] = wall_ms
+            return result
+    raise RuntimeError(f"Benchmark child failed:\n{proc.stdout}\n{proc.stderr}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--import-budget-ms", type=float, default=600)
+    parser.add_argument("--first-response-budget-ms", type=float, default=900)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot_path = os.path.join(tmp, "schedule_snapshot.json")
+        _write_warm_snapshot(snapshot_path, args.games)
+        env = {
+            **os.environ,
+            "SNAPSHOT_PATH": snapshot_path,
+            "ARCHIVE_DB_PATH": os.path.join(tmp, "archive.sqlite3"),
+            # Background refresh jobs scrape (and import scrapers) on purpose;
+            # they are not part of what a request waits for.
+            "BACKGROUND_REFRESH_ENABLED": "false",
+        }
+        runs = [_run_once(env) for _ in range(args.runs)]
+
+    report = {
+        key: round(statistics.median(r[key] for r in runs), 1)
+        for key in (
+            "import_ms",
+            "startup_ms",
+            "first_root_ms",
+            "first_schedule_ms",
+            "process_wall_ms",
+        )
+    }
+    lazy_loaded = sorted({m for r in runs for m in r["lazy_modules_loaded"]})
+    statuses = sorted({(r["root_status"], r["schedule_status"]) for r in runs})
+    print(
+        json.dumps(
+            {
+                "runs": args.runs,
+                "median": report,
+                "statuses": statuses,
+                "lazy_modules_loaded": lazy_loaded,
+            },
+            indent=2,
+        )
+    )
+
+    failures = []
+    if report["import_ms"] > args.import_budget_ms:
+        failures.append(
+            f"import took {report['import_ms']}ms (budget {args.import_budget_ms}ms)"
+        )
+    slowest_first_response = max(report["first_root_ms"], report["first_schedule_ms"])
+    if slowest_first_response > args.first_response_budget_ms:
+        failures.append(
+            f"first response after {slowest_first_response}ms "
+            f"(budget {args.first_response_budget_ms}ms)"
+        )
+    if lazy_loaded:
+        failures.append(f"scraping dependencies imported at startup: {lazy_loaded}")
+    if statuses != [(200, 200)]:
+        failures.append(f"unexpected response statuses: {statuses}")
+
+    for failure in failures:
+        print(f"BUDGET EXCEEDED: {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
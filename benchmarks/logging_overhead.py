@@ -0,0 +1,93 @@
+"""
+Per-request logging cost on the cache-hit path.
+
+Times the same cache-hit log line three ways, with stdout redirected to a
+pipe that a slow reader drains (like a busy log shipper):
+
+  sync     - the old setup: StreamHandler(sys.stdout) on the request thread
+  queued   - logger.info() through the queue handler from setup_logging()
+  sampled  - log_sampled(), which is what the cache-hit paths now call
+
+    python benchmarks/logging_overhead.py --calls 20000
+"""
+
+import argparse
+import logging
+import os
+import sys
+import threading
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+
+def _slow_drain(fd: int, delay_s: float) -> None:
+    while os.read(fd, 4096):
+        time.sleep(delay_s)
+
+
+def _time_calls(func, calls: int) -> float:
+    """Mean cost of one call, in microseconds."""
+    started = time.perf_counter()
+    for _ in range(calls):
+        func()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument(
+        "--reader-delay-ms",
+        type=float,
+        default=1.0,
+        help="How long the stdout reader sleeps per 4 KiB chunk",
+    )
+    args = parser.parse_args()
+
+    real_stdout = os.dup(1)
+    read_fd, write_fd = os.pipe()
+    os.dup2(write_fd, 1)
+    threading.Thread(
+        target=_slow_drain, args=(read_fd, args.reader_delay_ms / 1000), daemon=True
+    ).start()
+    sys.stdout = os.fdopen(1, "w", buffering=1, closefd=False)
+
+    from core.logging_config import log_sampled, setup_logging, shutdown_logging
+
+    logger = logging.getLogger("benchmark")
+    root = logging.getLogger()
+
+    root.handlers.clear()
+    root.addHandler(logging.StreamHandler(sys.stdout))
+    root.setLevel(logging.INFO)
+    feed_key = "Cycling"
+    sync_us = _time_calls(
+        lambda: logger.info(f"News cache HIT for {feed_key}."), args.calls
+    )
+
+    setup_logging()
+    queued_us = _time_calls(
+        lambda: logger.info("News cache HIT for %s.", feed_key), args.calls
+    )
+    sampled_us = _time_calls(
+        lambda: log_sampled(logger, "bench_hit", "News cache HIT for %s.", feed_key),
+        args.calls,
+    )
+    shutdown_logging()
+
+    os.dup2(real_stdout, 1)
+    sys.stdout = os.fdopen(1, "w", closefd=False)
+    print(f"{'mode':<8} {'us/call':>9}")
+    for mode, cost in (
+        ("sync", sync_us),
+        ("queued", queued_us),
+        ("sampled", sampled_us),
+    ):
+        print(f"{mode:<8} {cost:>9.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+"""
+Throughput of the production server (serve.py) against the dev launch mode.
+
+Both servers get the same warm schedule snapshot, with background refresh
+off, so every request is a cache hit. "dev" is what `python main.py` runs:
+one uvicorn process with auto-reload. "serve" is gunicorn with preloaded
+uvicorn workers. Load comes from separate client processes (closed loop,
+one keep-alive connection per virtual user) hitting /api/v1/schedule/.
+
+    python benchmarks/serve_throughput.py --duration 10 --workers 4
+
+Gains scale with cores: on a single-core host both modes share one CPU
+with the load generator, and serve can only win on the faster worker
+setup, not on parallelism.
+"""
+
+import argparse
+import datetime as dt
+import http.client
+import json
+import multiprocessing
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PATH = "/api/v1/schedule/"
+
+
+def _write_warm_snapshot(path: str, n_games: int) -> None:
+    now = dt.datetime.now(dt.timezone.utc)
+    items = [
+        {
+            "game_id": f"BENCH_{i}",
+            "league": "Cycling - World Tour",
+            "start_time": (now + dt.timedelta(hours=6 * i)).isoformat(),
+            "status": "Scheduled",
+            "home_team": f"Benchmark Race {i // 5} - Stage {i % 5 + 1}",
+            "venue": "UCI 2.UWT",
+            "official_url": "https://www.procyclingstats.com/race/benchmark",
+        }
+        for i in range(n_games)
+    ]
+    with open(path, "w") as f:
+        json.dump({"timestamp": dt.datetime.now().isoformat(), "items": items}, f)
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _server_command(mode: str, port: int, workers: int) -> List[str]:
+    if mode == "dev":
+        return [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--reload",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ]
+    return [
+        sys.executable,
+        "serve.py",
+        "--bind",
+        f"127.0.0.1:{port}",
+        "--workers",
+        str(workers),
+    ]
+
+
+def _wait_until_up(proc: subprocess.Popen, port: int) -> None:
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError("server exited during startup")
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", PATH)
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError("server did not start within 30s")
+
+
+def _client_process(port: int, users: int, duration: float) -> List[float]:
+    """Runs `users` closed-loop users for `duration` seconds; returns latencies."""
+    latencies: List[float] = []
+    stop_at = time.monotonic() + duration
+
+    def user() -> None:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+        while time.monotonic() < stop_at:
+            started = time.perf_counter()
+            conn.request("GET", PATH)
+            response = conn.getresponse()
+            response.read()
+            if response.status == 200:
+                latencies.append((time.perf_counter() - started) * 1000)
+        conn.close()
+
+    threads = [threading.Thread(target=user) for _ in range(users)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies
+
+
+def run_mode(mode: str, env: Dict[str, str], args) -> dict:
+    port = _free_port()
+    with open(os.path.join(env["BENCH_TMP"], f"{mode}.log"), "wb") as log:
+        proc = subprocess.Popen(
+            _server_command(mode, port, args.workers),
+            cwd=REPO_ROOT,
+            env=env,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+        try:
+            _wait_until_up(proc, port)
+            users = max(args.concurrency // args.client_processes, 1)
+            with multiprocessing.Pool(args.client_processes) as pool:
+                results = pool.starmap(
+                    _client_process,
+                    [(port, users, args.duration)] * args.client_processes,
+                )
+        finally:
+            proc.terminate()
+            try:
+                proc.wait(timeout=15)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+    latencies = sorted(latency for result in results for latency in result)
+    return {
+        "requests": len(latencies),
+        "throughput_rps": round(len(latencies) / args.duration, 1),
+        "p50_ms": round(latencies[len(latencies) // 2], 2) if latencies else None,
+        "p99_ms": (
+            round(latencies[int(len(latencies) * 0.99)], 2) if latencies else None
+        ),
+        "mean_ms": round(statistics.fmean(latencies), 2) if latencies else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--client-processes", type=int, default=2)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--games", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot_path = os.path.join(tmp, "schedule_snapshot.json")
+        _write_warm_snapshot(snapshot_path, args.games)
+        env = {
+            **os.environ,
+            "BENCH_TMP": tmp,
+            "SNAPSHOT_PATH": snapshot_path,
+            "ARCHIVE_DB_PATH": os.path.join(tmp, "archive.sqlite3"),
+            "BACKGROUND_REFRESH_ENABLED": "false",
+            "LOG_FORMAT": "text",
+        }
+        report = {mode: run_mode(mode, env, args) for mode in ("dev", "serve")}
+
+    dev_rps = report["dev"]["throughput_rps"]
+    report["speedup"] = (
+        round(report["serve"]["throughput_rps"] / dev_rps, 2) if dev_rps else None
+    )
+    report["config"] = {
+        "cpu_count": os.cpu_count(),
+        "workers": args.workers,
+        "concurrency": args.concurrency,
+        "client_processes": args.client_processes,
+        "duration_s": args.duration,
+        "games": args.games,
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
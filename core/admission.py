@@ -0,0 +1,151 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from fastapi import HTTPException, Request
+
+from core.config import (
+    MISS_RATE_LIMIT_BURST,
+    MISS_RATE_LIMIT_PER_MINUTE,
+    RENDER_MAX_PENDING,
+    RENDER_MAX_WORKERS,
+    TRUSTED_PROXY_COUNT,
+    UPSTREAM_MAX_PENDING,
+    UPSTREAM_MAX_WORKERS,
+    UPSTREAM_RETRY_AFTER_SECONDS,
+)
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request may not start upstream work right now."""
+
+    status_code = 503
+
+    def __init__(self, detail: str, retry_after: int):
+        super().__init__(detail)
+        self.detail = detail
+        self.retry_after = retry_after
+
+    def to_http_exception(self) -> HTTPException:
+        return HTTPException(
+            status_code=self.status_code,
+            detail=self.detail,
+            headers={"Retry-After": str(self.retry_after)},
+        )
+
+
+class UpstreamBusy(AdmissionRejected):
+    status_code = 503
+
+
+class RateLimited(AdmissionRejected):
+    status_code = 429
+
+
+class UpstreamExecutor:
+    """
+    A dedicated, bounded thread pool for blocking upstream work.
+
+    Concurrent calls for the same key share a single run (so a burst of
+    misses for one feed causes one scrape). When `max_pending` distinct
+    jobs are already in flight, new ones are rejected immediately with
+    UpstreamBusy instead of queueing.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        retry_after: int,
+        name: str = "upstream",
+    ):
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix=name
+        )
+        self._name = name
+        self._max_pending = max_pending
+        self._retry_after = retry_after
+        # Only touched from the event loop thread, so no lock is needed.
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    @property
+    def pending(self) -> int:
+        return len(self._inflight)
+
+    async def run(self, key: str, func: Callable[[], Any]) -> Any:
+        future = self._inflight.get(key)
+        if future is None:
+            if len(self._inflight) >= self._max_pending:
+                raise UpstreamBusy(
+                    f"{self._name.capitalize()} capacity exhausted, try again shortly.",
+                    self._retry_after,
+                )
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.executor, func)
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # shield: one caller disconnecting must not cancel the shared job
+        return await asyncio.shield(future)
+
+
+class RateLimiter:
+    """Per-client token buckets (`rate_per_minute` refill, `burst` capacity)."""
+
+    def __init__(self, rate_per_minute: float, burst: int, max_clients: int = 10000):
+        self._rate = rate_per_minute / 60.0
+        self._burst = burst
+        self._max_clients = max_clients
+        self._buckets: "OrderedDict[str, list]" = OrderedDict()
+
+    def check(self, client_key: str) -> None:
+        """Takes one token for `client_key`; raises RateLimited if there is none."""
+        now = time.monotonic()
+        bucket = self._buckets.pop(client_key, None)
+        if bucket is None:
+            bucket = [float(self._burst), now]
+        tokens = min(self._burst, bucket[0] + (now - bucket[1]) * self._rate)
+
+        allowed = tokens >= 1.0
+        bucket[0], bucket[1] = (tokens - 1.0 if allowed else tokens), now
+
+        # Most recently seen clients live at the end; drop the oldest.
+        self._buckets[client_key] = bucket
+        while len(self._buckets) > self._max_clients:
+            self._buckets.popitem(last=False)
+
+        if not allowed:
+            retry_after = math.ceil((1.0 - tokens) / self._rate) if self._rate else 60
+            raise RateLimited("Too many uncached requests.", retry_after)
+
+
+def client_key(request: Request) -> str:
+    """
+    Identifies the caller. Behind our host's proxy every request comes from
+    the proxy, so we use the X-Forwarded-For hop that the outermost trusted
+    proxy appended. Hops left of it are whatever the client sent, and
+    keying on them would let a client pick a fresh rate-limit bucket for
+    every request.
+    """
+    forwarded_for = request.headers.get("x-forwarded-for")
+    if forwarded_for and TRUSTED_PROXY_COUNT > 0:
+        hops = [hop.strip() for hop in forwarded_for.split(",")]
+        return hops[-min(TRUSTED_PROXY_COUNT, len(hops))]
+    return request.client.host if request.client else "unknown"
+
+
+def check_miss_rate_limit(request: Request) -> None:
+    MISS_RATE_LIMITER.check(client_key(request))
+
+
+UPSTREAM = UpstreamExecutor(
+    UPSTREAM_MAX_WORKERS, UPSTREAM_MAX_PENDING, UPSTREAM_RETRY_AFTER_SECONDS
+)
+# Cold schedule renders (a timezone, projection, window or feed not built
+# yet for the current version): CPU work, kept off the event loop
+RENDERS = UpstreamExecutor(
+    RENDER_MAX_WORKERS, RENDER_MAX_PENDING, UPSTREAM_RETRY_AFTER_SECONDS, "render"
+)
+MISS_RATE_LIMITER = RateLimiter(MISS_RATE_LIMIT_PER_MINUTE, MISS_RATE_LIMIT_BURST)
@@ -0,0 +1,216 @@
+import random
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from types import FunctionType, ModuleType
+from typing import Any, Dict, Hashable, List, Optional
+
+from core.config import CACHE_TTL_JITTER
+
+# Leaf values: counted by getsizeof alone, never walked into
+_ATOMIC_TYPES = (str, bytes, bytearray, int, float, bool, type(None), datetime)
+_SKIP_TYPES = (type, ModuleType, FunctionType)
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Approximate deep size of `value` in bytes: getsizeof summed over every
+    object reachable through containers and instance attributes. Objects
+    shared between entries are counted once per entry.
+    """
+    seen = set()
+    stack = [value]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SKIP_TYPES):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, _ATOMIC_TYPES):
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(vars(obj))
+        elif hasattr(obj, "__slots__"):
+            stack.extend(getattr(obj, name, None) for name in obj.__slots__)
+    return total
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    # When the cached data was produced (wall clock, like the rest of the app)
+    stored_at: datetime
+    # None = never expires (only evicted)
+    expires_at: Optional[datetime]
+    size: int
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires_at is None or datetime.now() < self.expires_at
+
+
+class TTLCache:
+    """
+    One cache namespace: entries expire after `ttl` (shortened by up to
+    `jitter` of it at random, so entries stored together don't all expire
+    together) and the least recently used are evicted once the namespace
+    holds more than `max_entries` entries or `max_bytes` estimated bytes.
+
+    Expired entries are kept until evicted, so callers can still serve
+    them stale (see get_entry). Safe to use from any thread.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: Optional[timedelta] = None,
+        max_entries: int = 128,
+        max_bytes: Optional[int] = None,
+        jitter: float = CACHE_TTL_JITTER,
+    ):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.jitter = jitter
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._hits = self._stale_hits = self._misses = 0
+        self._evictions = self._sets = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """The value if it is cached and fresh, else `default`."""
+        entry = self.get_entry(key)
+        return entry.value if entry is not None and entry.fresh else default
+
+    def get_entry(self, key: Hashable) -> Optional[CacheEntry]:
+        """The entry, fresh or expired (check `.fresh`), or None if absent."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if entry.fresh:
+                self._hits += 1
+            else:
+                self._stale_hits += 1
+            return entry
+
+    def peek(self, key: Hashable) -> Optional[CacheEntry]:
+        """Like get_entry, without touching LRU order or statistics."""
+        return self._entries.get(key)
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        stored_at: Optional[datetime] = None,
+        size: Optional[int] = None,
+    ) -> CacheEntry:
+        """
+        Caches `value`. Pass `stored_at` when the data is older than now
+        (e.g. loaded from disk) so it expires relative to its real age.
+        """
+        stored_at = stored_at or datetime.now()
+        expires_at = None
+        if self.ttl is not None:
+            expires_at = stored_at + self.ttl * (1 - random.random() * self.jitter)
+        entry = CacheEntry(
+            value=value,
+            stored_at=stored_at,
+            expires_at=expires_at,
+            size=estimate_size(value) if size is None else size,
+        )
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+            self._sets += 1
+            self._evict()
+        return entry
+
+    def pop(self, key: Hashable) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry.size
+            return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _evict(self) -> None:
+        # Never evict the entry that was just stored, even if it alone is too big
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self._evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._hits + self._stale_hits + self._misses
+            return {
+                "namespace": self.name,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl.total_seconds() if self.ttl else None,
+                "hits": self._hits,
+                "stale_hits": self._stale_hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else None,
+                "sets": self._sets,
+                "evictions": self._evictions,
+            }
+
+
+_NAMESPACES: Dict[str, TTLCache] = {}
+_NAMESPACES_LOCK = threading.Lock()
+
+
+def cache_namespace(
+    name: str,
+    ttl: Optional[timedelta] = None,
+    max_entries: int = 128,
+    max_bytes: Optional[int] = None,
+    jitter: float = CACHE_TTL_JITTER,
+) -> TTLCache:
+    """Returns the named cache, creating it with these settings on first use."""
+    with _NAMESPACES_LOCK:
+        cache = _NAMESPACES.get(name)
+        if cache is None:
+            cache = _NAMESPACES[name] = TTLCache(
+                name, ttl, max_entries=max_entries, max_bytes=max_bytes, jitter=jitter
+            )
+        return cache
+
+
+def cache_stats() -> List[Dict[str, Any]]:
+    """Statistics for every cache namespace, by name."""
+    with _NAMESPACES_LOCK:
+        caches = sorted(_NAMESPACES.values(), key=lambda c: c.name)
+    return [cache.stats() for cache in caches]
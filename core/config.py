@@ -1,3 +1,5 @@
+import json
+import os
 import pytz
 from typing import Dict, List
 
@@ -15,7 +17,103 @@ LEAGUE_ID_MAP: Dict[str, Dict[str, str]] = {
     "World Cup Rock Climbing": {"source": "niche_scrape", "id": "ifsc_wiki"},
 }
 
-# --- Niche RSS Feed Master List ---
+# --- Cache Lifetimes ---
+SCHEDULE_CACHE_TTL_SECONDS = int(os.getenv("SCHEDULE_CACHE_TTL_SECONDS", str(4 * 3600)))
+NEWS_CACHE_TTL_SECONDS = int(os.getenv("NEWS_CACHE_TTL_SECONDS", str(30 * 60)))
+# Each entry's TTL is shortened by up to this fraction, at random, so
+# entries stored together don't all expire together
+CACHE_TTL_JITTER = float(os.getenv("CACHE_TTL_JITTER", "0.1"))
+# Size bounds (estimated bytes) for the caches that grow with leagues/feeds
+NEWS_CACHE_MAX_BYTES = int(os.getenv("NEWS_CACHE_MAX_BYTES", str(8 * 1024 * 1024)))
+SCHEDULE_RENDER_CACHE_MAX_BYTES = int(
+    os.getenv("SCHEDULE_RENDER_CACHE_MAX_BYTES", str(64 * 1024 * 1024))
+)
+
+# --- ProCyclingStats Source Configuration ---
+# Point this at a local stand-in for load tests.
+PCS_BASE_URL = os.getenv("PCS_BASE_URL", "https://www.procyclingstats.com")
+# League -> the PCS calendar circuit id its races are listed under. Each
+# circuit's calendar is fetched separately (and concurrently), and its races
+# are tagged with that league. Override with PCS_CIRCUITS_JSON.
+PCS_CIRCUITS: Dict[str, str] = {
+    "Cycling - World Tour": "1",
+    "Cycling - Pro Series": "2",
+}
+if os.getenv("PCS_CIRCUITS_JSON"):
+    PCS_CIRCUITS = json.loads(os.environ["PCS_CIRCUITS_JSON"])
+
+# --- Wikipedia Source Configuration ---
+# When enabled, the Wikipedia scrapers ask the MediaWiki parse API for just
+# the schedule section instead of downloading the full rendered article.
+WIKIPEDIA_USE_PARSE_API = os.getenv("WIKIPEDIA_USE_PARSE_API", "true").lower() == "true"
+# Point this at a local stand-in of the API for testing.
+WIKIPEDIA_BASE_URL = os.getenv("WIKIPEDIA_BASE_URL", "https://en.wikipedia.org")
+
+# --- Parse Process Pool ---
+# Worker processes for CPU-bound HTML parsing, so scrapes don't hold the
+# serving process's GIL. "auto" = one per spare core (up to 4); "0" parses
+# in-process.
+PARSE_POOL_WORKERS = os.getenv("PARSE_POOL_WORKERS", "auto")
+
+# --- Historical Event Archive ---
+# Every scraped event is kept here, so past seasons never need a re-scrape.
+ARCHIVE_DB_PATH = os.getenv("ARCHIVE_DB_PATH", "data/archive.sqlite3")
+# How many finished seasons (before the current year) to backfill once.
+ARCHIVE_BACKFILL_SEASONS = int(os.getenv("ARCHIVE_BACKFILL_SEASONS", "1"))
+
+# --- Warm Start Snapshot ---
+# The last scraped schedule is written here and loaded at startup, so a
+# freshly booted worker can serve /schedule without scraping first.
+SNAPSHOT_PATH = os.getenv("SNAPSHOT_PATH", "data/schedule_snapshot.json")
+
+# --- Schedule Delta Sync ---
+# How many past schedule versions /schedule/changes can diff against.
+# Clients further behind than this get a full reset instead.
+SCHEDULE_CHANGE_HISTORY = int(os.getenv("SCHEDULE_CHANGE_HISTORY", "24"))
+
+# --- Background Refresh ---
+# Refresh caches in-process before they expire, so requests never scrape.
+BACKGROUND_REFRESH_ENABLED = (
+    os.getenv("BACKGROUND_REFRESH_ENABLED", "true").lower() == "true"
+)
+# Refresh when a cache entry reaches this fraction of its TTL
+REFRESH_AHEAD_FACTOR = 0.75
+
+# --- Admission Control (cache-miss path) ---
+# Blocking upstream work (scrapes) runs on its own bounded thread pool,
+# so a burst of misses can't starve the threads that serve cache hits.
+UPSTREAM_MAX_WORKERS = int(os.getenv("UPSTREAM_MAX_WORKERS", "4"))
+# Distinct upstream jobs allowed in flight (running + queued) before we shed load
+UPSTREAM_MAX_PENDING = int(os.getenv("UPSTREAM_MAX_PENDING", "8"))
+UPSTREAM_RETRY_AFTER_SECONDS = int(os.getenv("UPSTREAM_RETRY_AFTER_SECONDS", "10"))
+# Cold schedule renders get their own small pool, under the same miss budget
+RENDER_MAX_WORKERS = int(os.getenv("RENDER_MAX_WORKERS", "2"))
+RENDER_MAX_PENDING = int(os.getenv("RENDER_MAX_PENDING", "16"))
+# Per-client budget for requests that would hit upstream (token bucket)
+MISS_RATE_LIMIT_PER_MINUTE = float(os.getenv("MISS_RATE_LIMIT_PER_MINUTE", "30"))
+MISS_RATE_LIMIT_BURST = int(os.getenv("MISS_RATE_LIMIT_BURST", "10"))
+# Proxies in front of the app that append to X-Forwarded-For. Clients are
+# told apart by the hop the outermost of them appended; anything left of it
+# is client-supplied. 0 = no proxy, use the peer address.
+TRUSTED_PROXY_COUNT = int(os.getenv("TRUSTED_PROXY_COUNT", "1"))
+
+# --- Production Server (serve.py) ---
+# gunicorn bind address and worker count ("auto" = one per CPU available)
+SERVE_BIND = os.getenv("SERVE_BIND", "0.0.0.0:8001")
+SERVE_WORKERS = os.getenv("SERVE_WORKERS", "auto")
+
+# --- News Feed Parsing ---
+# Stream-parse feeds and stop reading once we have the newest entries we
+# keep. Malformed feeds still fall back to feedparser.
+NEWS_STREAMING_PARSE = os.getenv("NEWS_STREAMING_PARSE", "true").lower() == "true"
+
+# --- Logging ---
+# "json" (one structured object per line) or "text"
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json").lower()
+# High-frequency events (e.g. cache hits) are logged at most once per
+# interval per event type, with a count of the ones skipped.
+LOG_SAMPLE_INTERVAL_SECONDS = float(os.getenv("LOG_SAMPLE_INTERVAL_SECONDS", "10"))
+
 # --- Niche RSS Feed Master List ---
 RSS_FEEDS: Dict[str, List[str]] = {
     "Cycling": [
@@ -24,3 +122,6 @@ RSS_FEEDS: Dict[str, List[str]] = {
     "Track & Field - Diamond League": ["https://www.letsrun.com/feed/"],
     "World Cup Rock Climbing": ["https://www.climbing.com/feed/"],
 }
+# Replace every feed at once (JSON object of name -> [urls]), e.g. for load tests
+if os.getenv("RSS_FEEDS_JSON"):
+    RSS_FEEDS = json.loads(os.environ["RSS_FEEDS_JSON"])
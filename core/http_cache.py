@@ -0,0 +1,65 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Iterator, Optional
+
+from fastapi import Request, Response
+
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def make_etag(data: bytes) -> str:
+    """Builds a strong ETag from a response body (or any stable digest input)."""
+    return '"' + hashlib.blake2b(data, digest_size=16).hexdigest() + '"'
+
+
+def validator_headers(etag: str, last_modified: datetime) -> Dict[str, str]:
+    """The validator headers we send on both 200 and 304 responses."""
+    return {
+        "ETag": etag,
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+    }
+
+
+def is_not_modified(
+    request: Request, etag: str, last_modified: Optional[datetime] = None
+) -> bool:
+    """
+    Evaluates If-None-Match / If-Modified-Since (RFC 9110 section 13.2.2).
+    If-None-Match takes precedence when both are present.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        candidates = {
+            tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+        }
+        return etag in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP dates only have second precision.
+        return last_modified.replace(microsecond=0) <= since
+
+    return False
+
+
+def iter_chunks(data: bytes) -> Iterator[bytes]:
+    """Streams cached bytes without copying the whole body per request."""
+    view = memoryview(data)
+    for start in range(0, len(view), STREAM_CHUNK_SIZE):
+        yield view[start : start + STREAM_CHUNK_SIZE]
+
+
+def cached_json_response(request: Request, body: bytes, etag: str) -> Response:
+    """Serves pre-serialized JSON, or a 304 if the client already has it."""
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
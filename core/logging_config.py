@@ -1,22 +1,131 @@
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from core.config import LOG_FORMAT, LOG_SAMPLE_INTERVAL_SECONDS
+
+# Attributes every LogRecord has; anything else was passed via `extra=`
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_LISTENER: Optional[logging.handlers.QueueListener] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including any `extra=` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class _InProcessQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueues the record untouched. The stock QueueHandler formats the
+    message first (so records can be pickled); our listener runs in this
+    process, so formatting is left to the writer thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
 
 
 def setup_logging():
-    """Sets up a basic logger to print formatted logs to the console."""
-    log_formatter = logging.Formatter("%(asctime)s [%(levelname)-5.5s]  %(message)s")
+    """
+    Sets up logging to print formatted logs to the console.
+
+    Callers only put records on a queue; a background thread formats them
+    and writes to stdout, so slow stdout I/O never blocks a request.
+    """
+    global _LISTENER
+    if LOG_FORMAT == "text":
+        log_formatter = logging.Formatter(
+            "%(asctime)s [%(levelname)-5.5s]  %(message)s"
+        )
+    else:
+        log_formatter = JsonFormatter()
     root_logger = logging.getLogger()
 
     # Clear any existing handlers to avoid duplicate logs
+    shutdown_logging()
     if root_logger.handlers:
         root_logger.handlers.clear()
 
-    # Set up a handler to print to the console (stdout)
+    # The console handler lives on the writer thread, behind the queue
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(log_formatter)
-    root_logger.addHandler(console_handler)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _LISTENER = logging.handlers.QueueListener(log_queue, console_handler)
+    _LISTENER.start()
+    root_logger.addHandler(_InProcessQueueHandler(log_queue))
 
     # Set the logging level to INFO
     root_logger.setLevel(logging.INFO)
 
     logging.info("Logging configured successfully.")
+
+
+def shutdown_logging() -> None:
+    """Flushes queued records and stops the writer thread."""
+    global _LISTENER
+    if _LISTENER is not None:
+        _LISTENER.stop()
+        _LISTENER = None
+
+
+atexit.register(shutdown_logging)
+
+
+class _Sampler:
+    __slots__ = ("next_emit", "suppressed")
+
+    def __init__(self):
+        self.next_emit = 0.0
+        self.suppressed = 0
+
+
+_SAMPLERS: Dict[str, _Sampler] = {}
+_SAMPLERS_LOCK = threading.Lock()
+
+
+def log_sampled(
+    logger: logging.Logger,
+    key: str,
+    msg: str,
+    *args,
+    level: int = logging.INFO,
+) -> None:
+    """
+    Logs `msg % args` at most once per LOG_SAMPLE_INTERVAL_SECONDS for each
+    `key`. Skipped calls cost a clock read and a counter bump; the next
+    record that does get logged carries their count as `suppressed`.
+    """
+    now = time.monotonic()
+    with _SAMPLERS_LOCK:
+        sampler = _SAMPLERS.get(key)
+        if sampler is None:
+            sampler = _SAMPLERS[key] = _Sampler()
+        if now < sampler.next_emit:
+            sampler.suppressed += 1
+            return
+        suppressed, sampler.suppressed = sampler.suppressed, 0
+        sampler.next_emit = now + LOG_SAMPLE_INTERVAL_SECONDS
+    if logger.isEnabledFor(level):
+        logger.log(level, msg, *args, extra={"event": key, "suppressed": suppressed})
+
@@ -0,0 +1,5 @@
+"""
+Load-test harness: runs the API against local stand-in upstreams.
+
+    python -m loadtest.run --scenarios cache_hit cache_miss upstream_failure
+"""
@@ -0,0 +1,252 @@
+"""
+A local stand-in for every upstream the scrapers talk to.
+
+It impersonates ProCyclingStats (/races.php), Wikipedia (/wiki/<page> and
+the MediaWiki parse API at /w/api.php) and the RSS feeds (/feeds/<name>.xml),
+with configurable latency, error rate and payload size.
+"""
+
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from email.utils import format_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Tuple
+from urllib.parse import parse_qs, urlparse
+
+FEED_NAMES = ("cycling", "athletics", "climbing")
+
+
+@dataclass
+class MockConfig:
+    latency_ms: float = 0.0
+    latency_jitter_ms: float = 0.0
+    # Fraction of requests answered with HTTP 500
+    error_rate: float = 0.0
+    # Rows per schedule table / items per feed
+    races: int = 120
+    meets: int = 15
+    climbing_events: int = 12
+    feed_items: int = 50
+
+
+def _event_dates(year: int, count: int) -> List[date]:
+    """`count` dates spread over what is left of `year` (or all of a past year)."""
+    today = datetime.now(timezone.utc).date()
+    first = max(date(year, 1, 1), today + timedelta(days=1))
+    last = date(year, 12, 28)
+    if first > last:
+        first = date(year, 1, 1)
+    span = max((last - first).days, 1)
+    return [first + timedelta(days=span * i // max(count, 1)) for i in range(count)]
+
+
+def _pcs_calendar(year: int, config: MockConfig, circuit: str = "1") -> str:
+    # Circuit 1 is the World Tour; every other circuit lists its own races
+    name, level = (
+        ("Mock Race", "UWT") if circuit == "1" else (f"Mock C{circuit}", "Pro")
+    )
+    rows = []
+    for i, start in enumerate(_event_dates(year, config.races)):
+        stage_days = (0, 0, 4, 6, 20)[i % 5]
+        end = min(start + timedelta(days=stage_days), date(start.year, start.month, 28))
+        if end > start:
+            date_str = (
+                f"{start.day:02d}.{start.month:02d} - {end.day:02d}.{end.month:02d}"
+            )
+        else:
+            date_str = f"{start.day:02d}.{start.month:02d}"
+        rows.append(
+            f"<tr><td>{date_str}</td><td></td>"
+            f"<td><a href='race/mock-race-{i}/{year}'>{name} {i}</a></td>"
+            f"<td>{2 if stage_days else 1}.{level}</td></tr>"
+        )
+    return (
+        "<html><body><table class='basic'>"
+        "<tr><th>Date</th><th>Date</th><th>Race</th><th>Class</th></tr>"
+        + "".join(rows)
+        + "</table></body></html>"
+    )
+
+
+def _diamond_league_section(year: int, config: MockConfig) -> str:
+    rows = "".join(
+        f"<tr><td>{i + 1}</td><td>{d.day} {d.strftime('%B')}</td>"
+        f"<td><a href='/wiki/Mock_Meet_{i}'>Mock Meet {i}</a></td>"
+        f"<td>Mock Stadium {i}</td><td>Mock City {i}, Mockland</td></tr>"
+        for i, d in enumerate(_event_dates(year, config.meets))
+    )
+    return (
+        "<div class='mw-heading mw-heading2'><h2 id='Schedule'>Schedule</h2></div>"
+        "<table class='wikitable'><tbody>"
+        "<tr><th>#</th><th>Date</th><th>Meet</th><th>Stadium</th><th>City</th></tr>"
+        f"{rows}</tbody></table>"
+    )
+
+
+def _climbing_section(year: int, config: MockConfig) -> str:
+    rows = "".join(
+        f"<tr><td>{i + 1}</td><td><a href='/wiki/Mock_City_{i}'>Mock City {i}</a> "
+        f"Mockland<br/>{d.day}–{d.day + 2 if d.day < 26 else d.day} "
+        f"{d.strftime('%B')}</td><td>M/W</td><td>–</td><td>M/W</td></tr>"
+        for i, d in enumerate(_event_dates(year, config.climbing_events))
+    )
+    return (
+        "<div class='mw-heading mw-heading2'><h2 id='Overview'>Overview</h2></div>"
+        "<table class='wikitable'><tbody>"
+        "<tr><th>No.</th><th>Location</th><th>Boulder</th><th>Lead</th><th>Speed</th></tr>"
+        f"{rows}</tbody></table>"
+    )
+
+
+# A realistic amount of article chrome that the section API lets us skip
+_ARTICLE_FILLER = (
+    "<div class='navbox'>" + "<p>Lorem ipsum dolor sit amet.</p>" * 400 + "</div>"
+)
+
+_SECTIONS = {
+    "Diamond_League": ("Schedule", _diamond_league_section),
+    "IFSC_Climbing_World_Cup": ("Overview", _climbing_section),
+}
+
+
+def _wiki_page(page: str, config: MockConfig) -> Tuple[str, str, str]:
+    """Returns (section title, section HTML, full article HTML) for a page title."""
+    year_str, _, kind = page.partition("_")
+    if kind not in _SECTIONS or not year_str.isdigit():
+        raise KeyError(page)
+    title, render = _SECTIONS[kind]
+    section = render(int(year_str), config)
+    return (
+        title,
+        section,
+        f"<html><body>{_ARTICLE_FILLER}{section}{_ARTICLE_FILLER}</body></html>",
+    )
+
+
+def _rss_feed(name: str, config: MockConfig) -> str:
+    now = datetime.now(timezone.utc)
+    items = "".join(
+        f"<item><title>{name} story {i}</title>"
+        f"<link>http://mock/{name}/{i}</link>"
+        f"<description><![CDATA[<p>Summary <b>{i}</b> "
+        + "text " * 80
+        + "</p>]]></description>"
+        f"<pubDate>{format_datetime(now - timedelta(hours=i))}</pubDate></item>"
+        for i in range(config.feed_items)
+    )
+    return (
+        "<?xml version='1.0' encoding='UTF-8'?><rss version='2.0'><channel>"
+        f"<title>{name}</title><link>http://mock/{name}</link>"
+        f"<description>Mock feed</description>{items}</channel></rss>"
+    )
+
+
+class MockUpstream:
+    """Runs the stand-in server on a background thread."""
+
+    def __init__(self, config: MockConfig, host: str = "127.0.0.1", port: int = 0):
+        self.config = config
+        self.requests_served = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def feed_urls(self) -> dict:
+        """The RSS_FEEDS mapping that points the API at this server."""
+        return {
+            "Cycling": [f"{self.base_url}/feeds/cycling.xml"],
+            "Track & Field - Diamond League": [f"{self.base_url}/feeds/athletics.xml"],
+            "World Cup Rock Climbing": [f"{self.base_url}/feeds/climbing.xml"],
+        }
+
+    def start(self) -> "MockUpstream":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _handler_class(self):
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send(self, status: int, body: str, content_type: str) -> None:
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                config = upstream.config
+                with upstream._lock:
+                    upstream.requests_served += 1
+
+                delay = config.latency_ms + random.uniform(0, config.latency_jitter_ms)
+                if delay:
+                    time.sleep(delay / 1000)
+                if random.random() < config.error_rate:
+                    return self._send(500, "mock upstream failure", "text/plain")
+
+                url = urlparse(self.path)
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                try:
+                    if url.path == "/races.php":
+                        year = int(query.get("year", datetime.now().year))
+                        circuit = query.get("circuit", "1")
+                        return self._send(
+                            200, _pcs_calendar(year, config, circuit), "text/html"
+                        )
+                    if url.path == "/w/api.php":
+                        return self._mediawiki_api(query)
+                    if url.path.startswith("/wiki/"):
+                        _, _, article = _wiki_page(url.path[len("/wiki/") :], config)
+                        return self._send(200, article, "text/html")
+                    if url.path.startswith("/feeds/") and url.path.endswith(".xml"):
+                        name = url.path[len("/feeds/") : -len(".xml")]
+                        if name in FEED_NAMES:
+                            return self._send(
+                                200, _rss_feed(name, config), "application/rss+xml"
+                            )
+                except KeyError:
+                    pass
+                self._send(404, "not found", "text/plain")
+
+            def _mediawiki_api(self, query: dict) -> None:
+                try:
+                    title, section, _ = _wiki_page(
+                        query.get("page", ""), upstream.config
+                    )
+                except KeyError:
+                    body = {"error": {"code": "missingtitle", "info": "missing"}}
+                    return self._send(200, json.dumps(body), "application/json")
+
+                if query.get("prop") == "sections":
+                    sections = [
+                        {"toclevel": 1, "line": "Background", "index": "1"},
+                        {"toclevel": 1, "line": title, "index": "2"},
+                        {"toclevel": 1, "line": "References", "index": "3"},
+                    ]
+                    body = {"parse": {"sections": sections}}
+                else:
+                    body = {"parse": {"text": section}}
+                self._send(200, json.dumps(body), "application/json")
+
+        return Handler
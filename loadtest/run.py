@@ -0,0 +1,300 @@
+"""
+Drives concurrent traffic at the API under a few upstream conditions
+and writes a JSON report that can be compared across runs.
+
+Each scenario starts a fresh API process (uvicorn) pointed at a local
+MockUpstream, warms it up, then runs closed-loop virtual users against
+/schedule, /news/{league} and /leagues/ for a fixed duration.
+
+    python -m loadtest.run --duration 20 --concurrency 16
+    python -m loadtest.run --scenarios cache_miss --upstream-latency-ms 300
+"""
+
+import argparse
+import http.client
+import json
+import os
+import platform
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from dataclasses import asdict, replace
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
+from urllib.parse import quote
+
+from loadtest.mock_upstream import MockConfig, MockUpstream
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Every request that should miss the cache has to reach upstream
+_ALWAYS_MISS = {
+    "SCHEDULE_CACHE_TTL_SECONDS": "0",
+    "NEWS_CACHE_TTL_SECONDS": "0",
+    "BACKGROUND_REFRESH_ENABLED": "false",
+}
+
+SCENARIOS: Dict[str, Tuple[Dict[str, str], MockConfig]] = {
+    # Warm caches, upstream never touched while measuring
+    "cache_hit": ({"BACKGROUND_REFRESH_ENABLED": "false"}, MockConfig()),
+    # Every request misses; upstream is healthy but not instant
+    "cache_miss": (_ALWAYS_MISS, MockConfig(latency_ms=50, latency_jitter_ms=50)),
+    # Every request misses and upstream is slow and failing
+    "upstream_failure": (
+        _ALWAYS_MISS,
+        MockConfig(latency_ms=200, latency_jitter_ms=200, error_rate=1.0),
+    ),
+}
+
+NEWS_LEAGUES = (
+    "Cycling - World Tour",
+    "Track & Field - Diamond League",
+    "World Cup Rock Climbing",
+)
+
+# (path, weight): most traffic is the schedule page
+TRAFFIC_MIX = [("/api/v1/schedule/", 6), ("/api/v1/leagues/", 1)] + [
+    (f"/api/v1/news/{quote(league)}", 1) for league in NEWS_LEAGUES
+]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _start_api(env: Dict[str, str], port: int, log_path: str) -> subprocess.Popen:
+    log = open(log_path, "wb")
+    proc = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=REPO_ROOT,
+        env=env,
+        stdout=log,
+        stderr=subprocess.STDOUT,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"API exited during startup; see {log_path}")
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/")
+            if conn.getresponse().status == 200:
+                return proc
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError(f"API did not start within 30s; see {log_path}")
+
+
+def _virtual_user(
+    port: int, stop_at: float, seed: int, samples: List[Tuple[str, int, float]]
+) -> None:
+    rng = random.Random(seed)
+    paths = [path for path, _ in TRAFFIC_MIX]
+    weights = [weight for _, weight in TRAFFIC_MIX]
+    # Each user looks like a distinct client to the per-client rate limiter:
+    # we play the trusted proxy, which appends the client address last
+    headers = {"X-Forwarded-For": f"10.0.{seed // 250}.{seed % 250 + 1}"}
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+
+    while time.monotonic() < stop_at:
+        path = rng.choices(paths, weights)[0]
+        started = time.perf_counter()
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            status = 0  # connection-level failure
+            conn.close()
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+        samples.append((path, status, (time.perf_counter() - started) * 1000))
+    conn.close()
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(
+        int(round(pct / 100 * (len(sorted_values) - 1))), len(sorted_values) - 1
+    )
+    return sorted_values[index]
+
+
+def _summarize(samples: List[Tuple[str, int, float]], duration: float) -> dict:
+    by_path = defaultdict(list)
+    for path, status, latency in samples:
+        by_path[path].append((status, latency))
+    by_path["ALL"] = [(status, latency) for _, status, latency in samples]
+
+    summary = {}
+    for path, results in sorted(by_path.items()):
+        latencies = sorted(latency for _, latency in results)
+        statuses = defaultdict(int)
+        for status, _ in results:
+            statuses[str(status)] += 1
+        summary[path] = {
+            "requests": len(results),
+            "throughput_rps": round(len(results) / duration, 1),
+            "p50_ms": round(_percentile(latencies, 50), 2),
+            "p90_ms": round(_percentile(latencies, 90), 2),
+            "p99_ms": round(_percentile(latencies, 99), 2),
+            "max_ms": round(latencies[-1], 2) if latencies else 0.0,
+            "mean_ms": round(statistics.fmean(latencies), 2) if latencies else 0.0,
+            "status_counts": dict(statuses),
+        }
+    return summary
+
+
+def run_scenario(name: str, mock_config: MockConfig, args) -> dict:
+    server_env_overrides, _ = SCENARIOS[name]
+    upstream = MockUpstream(mock_config).start()
+    port = _free_port()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {
+            **os.environ,
+            **server_env_overrides,
+            "PCS_BASE_URL": upstream.base_url,
+            "WIKIPEDIA_BASE_URL": upstream.base_url,
+            "RSS_FEEDS_JSON": json.dumps(upstream.feed_urls()),
+            "SNAPSHOT_PATH": os.path.join(tmp, "snapshot.json"),
+            "ARCHIVE_DB_PATH": os.path.join(tmp, "archive.sqlite3"),
+            "MISS_RATE_LIMIT_PER_MINUTE": str(args.rate_limit_per_minute),
+        }
+        api = _start_api(env, port, os.path.join(tmp, "api.log"))
+        try:
+            # Warm-up: fill the caches (and import the scrapers) before measuring
+            for path, _ in TRAFFIC_MIX:
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=120)
+                conn.request("GET", path)
+                conn.getresponse().read()
+                conn.close()
+            upstream_before = upstream.requests_served
+
+            samples: List[Tuple[str, int, float]] = []
+            stop_at = time.monotonic() + args.duration
+            users = [
+                threading.Thread(
+                    target=_virtual_user, args=(port, stop_at, seed, samples)
+                )
+                for seed in range(args.concurrency)
+            ]
+            started = time.monotonic()
+            for user in users:
+                user.start()
+            for user in users:
+                user.join()
+            elapsed = time.monotonic() - started
+        finally:
+            api.terminate()
+            try:
+                api.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                api.kill()
+            upstream.stop()
+
+    return {
+        "server_env": server_env_overrides,
+        "mock_upstream": asdict(mock_config),
+        "upstream_requests": upstream.requests_served - upstream_before,
+        "endpoints": _summarize(samples, elapsed),
+    }
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS)
+    )
+    parser.add_argument(
+        "--duration", type=float, default=15, help="seconds per scenario"
+    )
+    parser.add_argument("--concurrency", type=int, default=16, help="virtual users")
+    parser.add_argument("--rate-limit-per-minute", type=float, default=1_000_000)
+    parser.add_argument("--upstream-latency-ms", type=float)
+    parser.add_argument("--upstream-error-rate", type=float)
+    parser.add_argument(
+        "--payload-scale",
+        type=float,
+        default=1.0,
+        help="multiplies rows per schedule table and items per feed",
+    )
+    parser.add_argument("--output", default="loadtest_report.json")
+    args = parser.parse_args()
+
+    report = {
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "git_revision": _git_revision(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+        "duration_s": args.duration,
+        "concurrency": args.concurrency,
+        "scenarios": {},
+    }
+    for name in args.scenarios:
+        mock_config = SCENARIOS[name][1]
+        base = MockConfig()
+        mock_config = replace(
+            mock_config,
+            races=int(base.races * args.payload_scale),
+            meets=int(base.meets * args.payload_scale),
+            climbing_events=int(base.climbing_events * args.payload_scale),
+            feed_items=int(base.feed_items * args.payload_scale),
+        )
+        if args.upstream_latency_ms is not None:
+            mock_config = replace(mock_config, latency_ms=args.upstream_latency_ms)
+        if args.upstream_error_rate is not None:
+            mock_config = replace(mock_config, error_rate=args.upstream_error_rate)
+
+        print(f"Running scenario {name}...", file=sys.stderr)
+        report["scenarios"][name] = run_scenario(name, mock_config, args)
+        overall = report["scenarios"][name]["endpoints"]["ALL"]
+        print(
+            f"  {overall['requests']} requests, {overall['throughput_rps']} req/s, "
+            f"p50 {overall['p50_ms']}ms, p99 {overall['p99_ms']}ms, "
+            f"statuses {overall['status_counts']}",
+            file=sys.stderr,
+        )
+
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Report written to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,24 +1,73 @@
+import random
 import uvicorn
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
-
-# --- THIS IS THE MODERN (V2) SYNTAX ---
-# It is 100% compatible with the 'fastapi-cache2' library
-from fastapi_cache import FastAPICache
-from fastapi_cache.backends.inmemory import InMemoryBackend
+from functools import partial
 
 from api.v1.api import api_router
-from core.logging_config import setup_logging
+from api.v1.endpoints import news, public_schedule
+from core.admission import UPSTREAM
+from core.config import BACKGROUND_REFRESH_ENABLED, REFRESH_AHEAD_FACTOR, RSS_FEEDS
+from core.logging_config import setup_logging, shutdown_logging
+from services.parse_pool import start_parse_pool, stop_parse_pool
+from services.refresh_scheduler import RefreshScheduler
+
+
+def _build_refresh_scheduler() -> RefreshScheduler:
+    """Registers a refresh job for the schedule and for every news feed."""
+    # Scrapes share the bounded upstream pool with request-driven misses
+    scheduler = RefreshScheduler(executor=UPSTREAM.executor)
+    scheduler.add_job(
+        "schedule",
+        public_schedule.refresh_schedule,
+        interval=public_schedule.CACHE_DURATION * REFRESH_AHEAD_FACTOR,
+        # serve.py workers all start with the same snapshot; stagger them so
+        # one scrapes and the rest pick up its snapshot (see snapshot_lock)
+        initial_delay=(
+            public_schedule.seconds_until_schedule_refresh(REFRESH_AHEAD_FACTOR)
+            + random.uniform(0, 60)
+        ),
+    )
+    for feed_key in RSS_FEEDS:
+        scheduler.add_job(
+            f"news:{feed_key}",
+            partial(news.refresh_news_feed, feed_key),
+            interval=news.CACHE_DURATION * REFRESH_AHEAD_FACTOR,
+            # Spread the first fetches out instead of hitting every feed at once
+            initial_delay=(
+                news.seconds_until_news_refresh(feed_key, REFRESH_AHEAD_FACTOR)
+                + random.uniform(0, 30)
+            ),
+        )
+    return scheduler
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     setup_logging()
 
-    FastAPICache.init(InMemoryBackend(), prefix="fastapi-cache")
+    # Serve the last known schedule immediately instead of scraping on boot.
+    # Under serve.py the gunicorn master has already loaded it before forking.
+    if not public_schedule.schedule_loaded():
+        public_schedule.load_schedule_snapshot()
+
+    # Warm parse workers before the first scrape needs them
+    start_parse_pool()
+
+    scheduler = None
+    if BACKGROUND_REFRESH_ENABLED:
+        scheduler = _build_refresh_scheduler()
+        await scheduler.start()
 
     yield
 
+    if scheduler is not None:
+        await scheduler.stop()
+    stop_parse_pool()
+
+    # Flush anything still queued for the log writer
+    shutdown_logging()
+
 
 app = FastAPI(title="Niche-Lite Sports API", lifespan=lifespan)
 
@@ -33,5 +82,6 @@ def read_root():
 app.include_router(api_router, prefix="/api/v1")
 
 
+# Development server (auto-reload). In production, run `python serve.py`.
 if __name__ == "__main__":
     uvicorn.run("main:app", host="0.0.0.0", port=8001, reload=True)
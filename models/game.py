@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
@@ -27,3 +27,51 @@ class Game(BaseModel):
     # We removed the 'class Config' block
     # It was only needed for SQLAlchemy (from_attributes = True)
     # Since we have no database, it's no longer needed.
+
+
+class ScheduleByDay(BaseModel):
+    """Upcoming games grouped by their local calendar date in `timezone`."""
+
+    timezone: str
+    days: Dict[str, List[Game]]
+
+
+class ScheduleChanges(BaseModel):
+    """
+    What changed in the schedule between version `since` and `version`.
+    When `reset` is true, `since` was unknown (or too old) and `added`
+    holds the complete schedule: replace local state instead of patching.
+    """
+
+    version: int
+    since: int
+    reset: bool = False
+    added: List[Game]
+    modified: List[Game]
+    removed: List[str]
+
+
+class EventRange(BaseModel):
+    """
+    A multi-day event (e.g. a stage race) stored once instead of once per
+    day. Day N (counting from 1) starts at start_time + N-1 days; see
+    services.event_ranges for how it expands into per-day Games.
+    """
+
+    id_prefix: str
+    league: str
+    name: str
+    start_time: datetime  # start of the first day
+    end_time: datetime  # start of the last day
+    stage_count: int
+    status: str
+    venue: Optional[str] = None
+    official_url: Optional[str] = None
+
+
+class ScheduleRanges(BaseModel):
+    """The upcoming schedule with multi-day events kept as one range each."""
+
+    version: int
+    events: List[Game]
+    ranges: List[EventRange]
@@ -0,0 +1,21 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel
+
+from models.game import Game
+
+
+class LeagueSummary(BaseModel):
+    """One league's row in /leagues/summary."""
+
+    league: str
+    league_id: str
+    upcoming_events: int
+    next_event: Optional[Game] = None
+    # When this league's source was last scraped successfully
+    last_updated: Optional[datetime] = None
+    # "ok", "empty" (the scrape returned nothing), "failed" or "unknown"
+    last_scrape_status: str = "unknown"
+    last_scrape_at: Optional[datetime] = None
+    last_scrape_error: Optional[str] = None
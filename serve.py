@@ -0,0 +1,102 @@
+"""
+Production server: gunicorn managing uvicorn workers.
+
+    python serve.py                                # SERVE_BIND, SERVE_WORKERS
+    python serve.py --bind 127.0.0.1:9000 --workers 4
+
+The app is imported, and the schedule snapshot loaded, once in the gunicorn
+master before any worker is forked. Workers start with a warm cache that
+they share with the master copy-on-write, instead of each importing and
+parsing it again. Each worker has its own refresh timer, but they refresh
+in turn under a lock on the snapshot: one scrapes, the others load what it
+saved. `python main.py` remains the auto-reloading dev server.
+"""
+
+import argparse
+import gc
+import logging
+import os
+from importlib.util import find_spec
+
+# A worker that parses in-process holds its GIL through the parse, stalling
+# every request it is serving. Workers refresh one at a time (snapshot_lock),
+# so one parse process each is enough; "auto" would start one per spare core
+# in every worker. Must be set before core.config loads.
+os.environ.setdefault("PARSE_POOL_WORKERS", "1")
+
+from gunicorn.app.base import BaseApplication  # noqa: E402
+
+from core.config import SERVE_BIND, SERVE_WORKERS  # noqa: E402
+
+try:
+    from uvicorn_worker import UvicornWorker
+except ImportError:
+    # Older uvicorn releases ship the gunicorn worker themselves
+    from uvicorn.workers import UvicornWorker
+
+logger = logging.getLogger("gunicorn.error")
+
+# The C event loop and HTTP parser, when installed (uvicorn[standard])
+EVENT_LOOP = "uvloop" if find_spec("uvloop") else "asyncio"
+HTTP_PARSER = "httptools" if find_spec("httptools") else "h11"
+
+
+class ServeWorker(UvicornWorker):
+    CONFIG_KWARGS = {"loop": EVENT_LOOP, "http": HTTP_PARSER}
+
+
+def worker_count() -> int:
+    if SERVE_WORKERS != "auto":
+        return max(int(SERVE_WORKERS), 1)
+    # Async workers each use one core; count only the cores we may run on
+    if hasattr(os, "sched_getaffinity"):
+        return max(len(os.sched_getaffinity(0)), 1)
+    return os.cpu_count() or 1
+
+
+class ServeApplication(BaseApplication):
+    def __init__(self, options: dict):
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        # With preload_app this runs once, in the master
+        import main
+        from api.v1.endpoints import public_schedule
+
+        logger.info(f"Event loop: {EVENT_LOOP}, HTTP parser: {HTTP_PARSER}.")
+        if public_schedule.load_schedule_snapshot():
+            logger.info("Preloaded the schedule snapshot for all workers.")
+        else:
+            logger.info("No schedule snapshot; workers will scrape on demand.")
+
+        # Move everything loaded so far out of the collector's generations:
+        # GC passes in the workers would otherwise write to (and so copy)
+        # the pages they share with the master.
+        gc.freeze()
+        return main.app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run the API under gunicorn.")
+    parser.add_argument("--bind", default=SERVE_BIND)
+    parser.add_argument("--workers", type=int, default=worker_count())
+    args = parser.parse_args()
+
+    ServeApplication(
+        {
+            "bind": args.bind,
+            "workers": args.workers,
+            "worker_class": ServeWorker,
+            "preload_app": True,
+            "keepalive": 5,
+        }
+    ).run()
+
+
+if __name__ == "__main__":
+    main()
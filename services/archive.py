@@ -0,0 +1,158 @@
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Iterable, List, Optional
+
+import pytz
+
+from core.config import ARCHIVE_DB_PATH
+from models.game import Game as PydanticGame
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    game_id    TEXT PRIMARY KEY,
+    league     TEXT NOT NULL,
+    start_time TEXT NOT NULL,
+    season     INTEGER NOT NULL,
+    payload    TEXT NOT NULL,
+    first_seen TEXT NOT NULL,
+    last_seen  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_league_start ON events (league, start_time);
+CREATE INDEX IF NOT EXISTS idx_events_start ON events (start_time);
+
+CREATE TABLE IF NOT EXISTS seasons (
+    source     TEXT NOT NULL,
+    season     INTEGER NOT NULL,
+    event_count INTEGER NOT NULL,
+    complete   INTEGER NOT NULL,
+    scraped_at TEXT NOT NULL,
+    PRIMARY KEY (source, season)
+);
+"""
+
+
+def _to_key(value: datetime) -> str:
+    """Timestamps are stored as fixed-width UTC strings so they sort correctly."""
+    if value.tzinfo is None:
+        value = pytz.utc.localize(value)
+    return value.astimezone(pytz.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class EventArchive:
+    """
+    An append-only SQLite store of every event we have ever scraped.
+
+    Rows are keyed by game_id, and are never deleted: re-scraping an event
+    only refreshes its payload and last_seen time. Range queries use the
+    (league, start_time) index instead of scanning.
+    """
+
+    def __init__(self, path: str):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def record_season(
+        self,
+        source: str,
+        season: int,
+        games: Iterable[PydanticGame],
+        complete: bool = False,
+    ) -> None:
+        """Upserts a season's events. `complete` marks it as never needing a re-scrape."""
+        now = _to_key(datetime.now(pytz.utc))
+        rows = [
+            (
+                g.game_id,
+                g.league,
+                _to_key(g.start_time),
+                season,
+                g.model_dump_json(),
+                now,
+                now,
+            )
+            for g in games
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT INTO events
+                    (game_id, league, start_time, season, payload, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (game_id) DO UPDATE SET
+                    league = excluded.league,
+                    start_time = excluded.start_time,
+                    payload = excluded.payload,
+                    last_seen = excluded.last_seen
+                """,
+                rows,
+            )
+            self._conn.execute(
+                """
+                INSERT INTO seasons (source, season, event_count, complete, scraped_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (source, season) DO UPDATE SET
+                    event_count = excluded.event_count,
+                    complete = MAX(seasons.complete, excluded.complete),
+                    scraped_at = excluded.scraped_at
+                """,
+                (source, season, len(rows), int(complete), now),
+            )
+
+    def is_season_complete(self, source: str, season: int) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT complete FROM seasons WHERE source = ? AND season = ?",
+                (source, season),
+            ).fetchone()
+        return bool(row and row[0])
+
+    def query(
+        self,
+        league: Optional[str] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[PydanticGame]:
+        """Returns archived events in [start, end), oldest first."""
+        clauses, params = [], []
+        if league:
+            clauses.append("league = ?")
+            params.append(league)
+        if start:
+            clauses.append("start_time >= ?")
+            params.append(_to_key(start))
+        if end:
+            clauses.append("start_time < ?")
+            params.append(_to_key(end))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT payload FROM events {where} "
+                "ORDER BY start_time, game_id LIMIT ? OFFSET ?",
+                (*params, limit, offset),
+            ).fetchall()
+        return [PydanticGame.model_validate_json(row[0]) for row in rows]
+
+
+_ARCHIVE: Optional[EventArchive] = None
+_ARCHIVE_LOCK = threading.Lock()
+
+
+def get_archive() -> EventArchive:
+    """Returns the process-wide archive, opening the database on first use."""
+    global _ARCHIVE
+    with _ARCHIVE_LOCK:
+        if _ARCHIVE is None:
+            logging.info(f"Opening event archive at {ARCHIVE_DB_PATH}.")
+            _ARCHIVE = EventArchive(ARCHIVE_DB_PATH)
+    return _ARCHIVE
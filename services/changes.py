@@ -0,0 +1,80 @@
+import hashlib
+from datetime import datetime
+from typing import Dict, List, Sequence, Tuple
+
+from models.game import Game as PydanticGame, ScheduleChanges
+from services.event_ranges import ScheduleEntry, entry_id, expand_entries, game_ids
+
+# entry id -> (content hash, the game_ids it expands to), for one schedule
+# version. Kept per entry, so a version costs one item per multi-day race.
+EntryHashes = Dict[str, Tuple[str, Tuple[str, ...]]]
+
+
+def entry_hashes(
+    entries: Sequence[ScheduleEntry], hashes: Dict[str, str], not_before: datetime
+) -> EntryHashes:
+    """Pairs each entry's content hash with the ids of its days from `not_before`."""
+    return {
+        entry_id(entry): (hashes[entry_id(entry)], game_ids(entry, not_before))
+        for entry in entries
+    }
+
+
+def schedule_hash(hashes: EntryHashes) -> str:
+    """
+    A hash of a whole schedule's content. Equal hashes mean nothing a
+    client could see changed, so the version number can stay the same.
+    """
+    body = repr(sorted(hashes.items())).encode("utf-8")
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def diff_entries(
+    since: int,
+    old_hashes: EntryHashes,
+    version: int,
+    entries: Sequence[ScheduleEntry],
+    new_hashes: EntryHashes,
+    not_before: datetime,
+) -> ScheduleChanges:
+    """
+    The added / modified / removed games between two versions. Only the
+    entries whose content changed are expanded; every day of a changed
+    range is sent, as modified if the client has it already.
+    """
+    added: List[PydanticGame] = []
+    modified: List[PydanticGame] = []
+    removed = []
+    for entry in entries:
+        new_hash, new_ids = new_hashes[entry_id(entry)]
+        old_hash, old_ids = old_hashes.get(entry_id(entry), (None, ()))
+        # Days that started between the versions are gone either way
+        removed.extend(set(old_ids).difference(new_ids))
+        if old_hash == new_hash:
+            continue
+        for game in expand_entries([entry], start=not_before):
+            (modified if game.game_id in old_ids else added).append(game)
+    for key, (_, old_ids) in old_hashes.items():
+        if key not in new_hashes:
+            removed.extend(old_ids)
+
+    added.sort(key=lambda game: game.start_time)
+    modified.sort(key=lambda game: game.start_time)
+    return ScheduleChanges(
+        version=version,
+        since=since,
+        added=added,
+        modified=modified,
+        removed=sorted(removed),
+    )
+
+
+def full_reset(version: int, games: List[PydanticGame]) -> ScheduleChanges:
+    """
+    A change set telling the client to replace its copy with `games`.
+    It is the diff against version 0 (the empty schedule), so one body
+    serves every client that is too far behind.
+    """
+    return ScheduleChanges(
+        version=version, since=0, reset=True, added=games, modified=[], removed=[]
+    )
@@ -0,0 +1,110 @@
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from models.game import Game as PydanticGame
+
+GAME_FIELDS: Tuple[str, ...] = tuple(PydanticGame.model_fields)
+
+RESPONSE_FORMATS = ("json", "columnar")
+
+
+def parse_fields(fields: Optional[str]) -> Tuple[str, ...]:
+    """
+    Turns a 'fields=a,b,c' parameter into a canonical tuple (model order,
+    no duplicates), so equivalent projections share one cached encoding.
+    Raises ValueError for unknown field names.
+    """
+    if not fields:
+        return GAME_FIELDS
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested - set(GAME_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return tuple(f for f in GAME_FIELDS if f in requested)
+
+
+def _dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _rows(games: List[PydanticGame], fields: Tuple[str, ...]) -> List[Dict[str, Any]]:
+    include = set(fields)
+    return [game.model_dump(mode="json", include=include) for game in games]
+
+
+def encode_rows(games: List[PydanticGame], fields: Tuple[str, ...]) -> bytes:
+    """The regular list-of-objects JSON, restricted to `fields`."""
+    return _dumps(_rows(games, fields))
+
+
+def encode_columnar(games: List[PydanticGame], fields: Tuple[str, ...]) -> bytes:
+    """
+    Encodes games column by column:
+
+        {"format": "columnar", "count": 3, "fields": [...],
+         "constants": {"status": "Scheduled", "logo_home": null},
+         "dictionaries": {"league": ["Cycling - World Tour", ...]},
+         "columns": {"game_id": ["...", ...], "league": [0, 0, 1]}}
+
+    A column whose value is the same on every row is sent once under
+    "constants". A string column that repeats values is dictionary-encoded:
+    its "columns" entry holds indexes into its "dictionaries" entry.
+    """
+    rows = _rows(games, fields)
+    constants: Dict[str, Any] = {}
+    dictionaries: Dict[str, List[Any]] = {}
+    columns: Dict[str, List[Any]] = {}
+
+    for field in fields:
+        values = [row[field] for row in rows]
+        distinct = list(dict.fromkeys(values))
+
+        if rows and len(distinct) == 1:
+            constants[field] = distinct[0]
+        elif len(distinct) * 2 <= len(values) and all(
+            isinstance(v, str) or v is None for v in distinct
+        ):
+            codes = {value: code for code, value in enumerate(distinct)}
+            dictionaries[field] = distinct
+            columns[field] = [codes[v] for v in values]
+        else:
+            columns[field] = values
+
+    return _dumps(
+        {
+            "format": "columnar",
+            "count": len(rows),
+            "fields": list(fields),
+            "constants": constants,
+            "dictionaries": dictionaries,
+            "columns": columns,
+        }
+    )
+
+
+def join_array(fragments: List[bytes]) -> bytes:
+    """A JSON array from already-serialized elements."""
+    return b"[" + b",".join(fragments) + b"]"
+
+
+def encode_days(
+    timezone: str, games: List[PydanticGame], fragments: List[bytes]
+) -> bytes:
+    """
+    A ScheduleByDay body ({"timezone": ..., "days": {date: [game, ...]}})
+    assembled from the games' already-serialized JSON (`fragments`, aligned
+    with `games`, which must have start_time_local set).
+    """
+    days: Dict[str, List[bytes]] = {}
+    for game, fragment in zip(games, fragments):
+        days.setdefault(game.start_time_local[:10], []).append(fragment)
+    return (
+        b'{"timezone":'
+        + _dumps(timezone)
+        + b',"days":{'
+        + b",".join(
+            _dumps(day) + b":" + join_array(day_games)
+            for day, day_games in days.items()
+        )
+        + b"}}"
+    )
@@ -0,0 +1,144 @@
+from bisect import bisect_left
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence, Tuple, Union
+
+from models.game import EventRange, Game as PydanticGame
+
+# What the scrapers hand to the schedule: single events, or whole multi-day ranges
+ScheduleEntry = Union[PydanticGame, EventRange]
+
+
+def entry_id(entry: ScheduleEntry) -> str:
+    """A single event's game_id, or a range's id_prefix."""
+    return entry.id_prefix if isinstance(entry, EventRange) else entry.game_id
+
+
+def last_start(entry: ScheduleEntry) -> datetime:
+    """When the entry's last (or only) day starts."""
+    return entry.end_time if isinstance(entry, EventRange) else entry.start_time
+
+
+def _day_offsets(
+    event_range: EventRange, start: Optional[datetime], end: Optional[datetime]
+) -> range:
+    """The range's days (0 = the first) that start in [start, end)."""
+    first, count = 0, event_range.stage_count
+    if start is not None and start > event_range.start_time:
+        first = -((event_range.start_time - start) // timedelta(days=1))
+    if end is not None:
+        count = min(count, -((event_range.start_time - end) // timedelta(days=1)))
+    return range(first, count)
+
+
+def _day_id(event_range: EventRange, stage: int) -> str:
+    return f"{event_range.id_prefix}_{(event_range.start_time + timedelta(days=stage)).day}"
+
+
+def expand_range(
+    event_range: EventRange,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> List[PydanticGame]:
+    """
+    Returns the range's per-day Games that start in [start, end) (either
+    bound may be None). Days outside the window are never built.
+    """
+    games = []
+    for stage in _day_offsets(event_range, start, end):
+        start_time = event_range.start_time + timedelta(days=stage)
+        name = event_range.name
+        if event_range.stage_count > 1:
+            name = f"{name} - Stage {stage + 1}"
+        games.append(
+            PydanticGame(
+                game_id=_day_id(event_range, stage),
+                league=event_range.league,
+                home_team=name,
+                away_team=None,
+                start_time=start_time,
+                status=event_range.status,
+                venue=event_range.venue,
+                official_url=event_range.official_url,
+            )
+        )
+    return games
+
+
+def expand_entries(
+    entries: Sequence[ScheduleEntry],
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> List[PydanticGame]:
+    """
+    Flattens entries into per-day Games, oldest first. Ranges are clipped
+    to [start, end); single events are kept as they are.
+    """
+    games: List[PydanticGame] = []
+    for entry in entries:
+        if isinstance(entry, EventRange):
+            games.extend(expand_range(entry, start, end))
+        else:
+            games.append(entry)
+    games.sort(key=lambda game: game.start_time)
+    return games
+
+
+def game_ids(entry: ScheduleEntry, start: Optional[datetime] = None) -> Tuple[str, ...]:
+    """
+    The game_ids an entry expands to from `start` on, without building the
+    Games. A single event is kept whatever `start` is, as in expand_entries.
+    """
+    if not isinstance(entry, EventRange):
+        return (entry.game_id,)
+    return tuple(_day_id(entry, stage) for stage in _day_offsets(entry, start, None))
+
+
+def next_start(entry: ScheduleEntry, start: datetime) -> Optional[datetime]:
+    """When the entry's first day starting at or after `start` begins, if any."""
+    if not isinstance(entry, EventRange):
+        return entry.start_time if entry.start_time >= start else None
+    days = _day_offsets(entry, start, None)
+    if not days:
+        return None
+    return entry.start_time + timedelta(days=days.start)
+
+
+def count_games(entry: ScheduleEntry, start: datetime) -> int:
+    """How many of the entry's days start at or after `start`."""
+    if not isinstance(entry, EventRange):
+        return int(entry.start_time >= start)
+    return len(_day_offsets(entry, start, None))
+
+
+def window_bounds(
+    start_times: List[datetime],
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> Tuple[int, int]:
+    """
+    The index range [lo, hi) of the games starting in [start, end), found
+    by bisecting `start_times` (the games' sorted start times).
+    """
+    lo = bisect_left(start_times, start) if start is not None else 0
+    hi = bisect_left(start_times, end) if end is not None else len(start_times)
+    return lo, max(lo, hi)
+
+
+def overlapping_entries(
+    entries: Sequence[ScheduleEntry],
+    entry_starts: List[datetime],
+    max_span: timedelta,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> List[ScheduleEntry]:
+    """
+    The entries with a day starting in [start, end). `entries` are sorted
+    by start_time (`entry_starts`) and no range is longer than `max_span`,
+    so only the entries starting in [start - max_span, end) are looked at.
+    """
+    lo, hi = window_bounds(
+        entry_starts, start - max_span if start is not None else None, end
+    )
+    return [
+        entry for entry in entries[lo:hi] if start is None or last_start(entry) >= start
+    ]
@@ -0,0 +1,66 @@
+import hashlib
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from services.event_ranges import ScheduleEntry, entry_id
+
+
+class EventStore:
+    """
+    The live schedule entries (single events and multi-day ranges), keyed
+    by game_id or, for a range, id_prefix.
+
+    A store is never changed in place: upsert() returns a new store, so a
+    request holding the current one never sees a half-applied refresh.
+    Entries whose content did not change keep the same object and the
+    same serialized bytes from one refresh to the next.
+    """
+
+    def __init__(self):
+        self._events: Dict[str, ScheduleEntry] = {}
+        # entry id -> (JSON body, ETag)
+        self._serialized: Dict[str, Tuple[bytes, str]] = {}
+        # entry id -> content hash
+        self._hashes: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._events
+
+    @property
+    def entries(self) -> List[ScheduleEntry]:
+        """Every entry, in the order they were upserted."""
+        return list(self._events.values())
+
+    @property
+    def hashes(self) -> Dict[str, str]:
+        return self._hashes
+
+    def get(self, key: str) -> Optional[ScheduleEntry]:
+        return self._events.get(key)
+
+    def get_json(self, key: str) -> Optional[Tuple[bytes, str]]:
+        """The entry's serialized (body, etag), or None."""
+        return self._serialized.get(key)
+
+    def upsert(self, entries: Iterable[ScheduleEntry]) -> "EventStore":
+        """
+        Returns a store holding exactly `entries`. An entry that is already
+        here with identical content is reused as is; entries missing from
+        `entries` are dropped. Later duplicates of an id win.
+        """
+        store = EventStore()
+        for entry in entries:
+            key = entry_id(entry)
+            body = entry.model_dump_json().encode("utf-8")
+            digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+            if self._hashes.get(key) == digest:
+                entry = self._events[key]
+                serialized = self._serialized[key]
+            else:
+                serialized = (body, f'"{digest}"')
+            store._events[key] = entry
+            store._serialized[key] = serialized
+            store._hashes[key] = digest
+        return store
@@ -0,0 +1,108 @@
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import IO, Iterator, Optional
+
+import pytz
+
+SUMMARY_MAX_CHARS = 250
+# Only this much raw HTML is ever sanitized: enough markup to fill a summary
+_SUMMARY_SCAN_CHARS = 4 * SUMMARY_MAX_CHARS
+
+_TAG_RE = re.compile("<[^<]+?>")
+# A tag cut in half by the truncation above
+_PARTIAL_TAG_RE = re.compile("<[^>]*$")
+
+_ENTRY_TAGS = {"item", "entry"}
+_SUMMARY_TAGS = ("description", "summary", "content")
+_DATE_TAGS = ("pubDate", "published", "updated", "date")
+
+
+@dataclass
+class FeedEntry:
+    title: str
+    link: Optional[str]
+    summary_html: Optional[str]
+    published: Optional[datetime]
+
+
+def clean_summary(summary_html: Optional[str]) -> str:
+    """Strips tags from the start of a summary, truncating before sanitizing."""
+    if summary_html is None:
+        summary_html = "No summary available."
+    text = _TAG_RE.sub("", summary_html[:_SUMMARY_SCAN_CHARS])
+    return _PARTIAL_TAG_RE.sub("", text)[:SUMMARY_MAX_CHARS]
+
+
+def parse_published(value: Optional[str]) -> Optional[datetime]:
+    """Parses an RSS (RFC 822) or Atom (ISO 8601) date as an aware UTC datetime."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    if parsed.tzinfo is None:
+        return pytz.utc.localize(parsed)
+    return parsed.astimezone(pytz.utc)
+
+
+def _localname(tag) -> str:
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _entry_from_element(element) -> FeedEntry:
+    fields = {}
+    link = None
+    for child in element:
+        name = _localname(child.tag)
+        if name == "link" and link is None:
+            # RSS puts the URL in the text, Atom in href (rel="alternate")
+            if child.get("href") and child.get("rel", "alternate") == "alternate":
+                link = child.get("href")
+            elif child.text and child.text.strip():
+                link = child.text.strip()
+        elif name not in fields:
+            fields[name] = child.text
+    return FeedEntry(
+        title=(fields.get("title") or "Untitled").strip(),
+        link=link,
+        summary_html=next(
+            (fields[tag] for tag in _SUMMARY_TAGS if fields.get(tag)), None
+        ),
+        published=next(
+            (
+                parsed
+                for tag in _DATE_TAGS
+                if (parsed := parse_published(fields.get(tag))) is not None
+            ),
+            None,
+        ),
+    )
+
+
+def iter_feed_entries(stream: IO[bytes]) -> Iterator[FeedEntry]:
+    """
+    Yields RSS <item> / Atom <entry> elements as they are parsed from
+    `stream`, so a caller can stop reading a feed part way through.
+    Parsed elements are freed as we go. Raises lxml.etree.XMLSyntaxError
+    for malformed feeds.
+    """
+    from lxml import etree
+
+    for _, element in etree.iterparse(
+        stream, events=("end",), resolve_entities=False, no_network=True
+    ):
+        if _localname(element.tag) not in _ENTRY_TAGS:
+            continue
+        yield _entry_from_element(element)
+        element.clear()
+        parent = element.getparent()
+        if parent is not None:
+            while element.getprevious() is not None:
+                del parent[0]
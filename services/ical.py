@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta
+from typing import Iterable
+
+import pytz
+
+from models.game import Game as PydanticGame
+
+PRODID = "-//The Aggregate//Niche-Lite Sports API//EN"
+
+
+def _escape(text: str) -> str:
+    """Escapes a TEXT value per RFC 5545 section 3.3.11."""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Folds a content line to 75 octets without splitting a UTF-8 character."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line
+
+    parts = []
+    current, current_len, limit = [], 0, 75
+    for char in line:
+        char_len = len(char.encode("utf-8"))
+        if current_len + char_len > limit:
+            parts.append("".join(current))
+            # Continuation lines start with a space, which counts toward 75.
+            current, current_len, limit = [], 0, 74
+        current.append(char)
+        current_len += char_len
+    parts.append("".join(current))
+    return "\r\n ".join(parts)
+
+
+def _event_lines(game: PydanticGame, dtstamp: str) -> Iterable[str]:
+    # Every source only publishes a date, so events are all-day. A multi-day
+    # stage race becomes one all-day event per stage, each with its own UID.
+    start_date = game.start_time.astimezone(pytz.utc).date()
+    end_date = start_date + timedelta(days=1)
+
+    yield "BEGIN:VEVENT"
+    yield f"UID:{game.game_id}@aggregated"
+    yield f"DTSTAMP:{dtstamp}"
+    yield f"DTSTART;VALUE=DATE:{start_date.strftime('%Y%m%d')}"
+    yield f"DTEND;VALUE=DATE:{end_date.strftime('%Y%m%d')}"
+    yield f"SUMMARY:{_escape(game.home_team)}"
+    yield f"CATEGORIES:{_escape(game.league)}"
+    if game.venue:
+        yield f"LOCATION:{_escape(game.venue)}"
+    if game.official_url:
+        yield f"URL:{game.official_url}"
+    yield "TRANSP:TRANSPARENT"
+    yield "END:VEVENT"
+
+
+def build_calendar(
+    games: Iterable[PydanticGame], name: str, generated_at: datetime
+) -> bytes:
+    """Renders a list of games as a complete iCalendar (RFC 5545) document."""
+    dtstamp = generated_at.astimezone(pytz.utc).strftime("%Y%m%dT%H%M%SZ")
+
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_escape(name)}",
+        # Hint to clients that polling faster than our refresh is pointless.
+        "REFRESH-INTERVAL;VALUE=DURATION:PT4H",
+        "X-PUBLISHED-TTL:PT4H",
+    ]
+    for game in games:
+        lines.extend(_event_lines(game, dtstamp))
+    lines.append("END:VCALENDAR")
+
+    return ("\r\n".join(_fold(line) for line in lines) + "\r\n").encode("utf-8")
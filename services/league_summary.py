@@ -0,0 +1,77 @@
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import pytz
+
+from core.config import LEAGUE_ID_MAP
+from models.game import EventRange, Game as PydanticGame
+from models.league import LeagueSummary
+from services.event_ranges import ScheduleEntry, count_games, expand_range, next_start
+
+# Schedule scraper -> the leagues its events belong to
+SCRAPER_LEAGUES: Dict[str, List[str]] = {
+    "cycling": ["Cycling - World Tour", "Cycling - Pro Series"],
+    "diamond_league": ["Track & Field - Diamond League"],
+    "climbing": ["World Cup Rock Climbing"],
+}
+
+
+def build_league_summaries(
+    entries: List[ScheduleEntry],
+    scrape_status: Dict[str, Dict[str, Any]],
+    schedule_timestamp: Optional[datetime],
+) -> Tuple[List[LeagueSummary], Optional[datetime]]:
+    """
+    Summarizes every league in LEAGUE_ID_MAP from the schedule's entries.
+    Ranges are counted by their upcoming days; only a league's next day
+    is ever built. Also returns when the result goes stale: the earliest
+    next-event start, after which that event is no longer upcoming.
+    """
+    now = datetime.now(pytz.utc)
+    counts = {league: 0 for league in LEAGUE_ID_MAP}
+    # league -> (start of its next day, the entry holding it)
+    next_entries: Dict[str, Tuple[datetime, ScheduleEntry]] = {}
+    for entry in entries:
+        starts_at = next_start(entry, now) if entry.league in counts else None
+        if starts_at is None:
+            continue
+        counts[entry.league] += count_games(entry, now)
+        if (
+            entry.league not in next_entries
+            or starts_at < next_entries[entry.league][0]
+        ):
+            next_entries[entry.league] = (starts_at, entry)
+
+    next_events: Dict[str, PydanticGame] = {}
+    for league, (starts_at, entry) in next_entries.items():
+        if isinstance(entry, EventRange):
+            entry = expand_range(entry, starts_at, starts_at + timedelta(seconds=1))[0]
+        next_events[league] = entry
+
+    league_status = {
+        league: status
+        for source, status in scrape_status.items()
+        for league in SCRAPER_LEAGUES.get(source, [])
+    }
+
+    summaries = []
+    for league, league_info in sorted(LEAGUE_ID_MAP.items()):
+        status = league_status.get(league, {})
+        summaries.append(
+            LeagueSummary(
+                league=league,
+                league_id=league_info["id"],
+                upcoming_events=counts[league],
+                next_event=next_events.get(league),
+                # Not scraped since startup: the data is as old as the snapshot
+                last_updated=(
+                    status.get("last_success") if status else schedule_timestamp
+                ),
+                last_scrape_status=status.get("status", "unknown"),
+                last_scrape_at=status.get("last_attempt"),
+                last_scrape_error=status.get("error"),
+            )
+        )
+
+    valid_until = min((game.start_time for game in next_events.values()), default=None)
+    return summaries, valid_until
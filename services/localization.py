@@ -0,0 +1,30 @@
+from datetime import tzinfo
+from typing import List
+
+import pytz
+
+from models.game import Game as PydanticGame
+
+
+def get_timezone(tz_name: str) -> tzinfo:
+    """
+    Returns a (shared) tz object. Raises pytz.UnknownTimeZoneError for bad names.
+    Names match case-insensitively; every spelling of a zone gets the one
+    object pytz caches under its canonical name (`.zone`), so nothing is
+    kept per spelling. Key anything cached per zone on `.zone`, too.
+    """
+    return pytz.timezone(tz_name)
+
+
+def localize_games(games: List[PydanticGame], tz: tzinfo) -> List[PydanticGame]:
+    """
+    Returns copies of the games with `start_time_local` filled in as an
+    ISO 8601 timestamp in `tz`. The cached originals are never mutated.
+    """
+    return [
+        game.model_copy(
+            update={"start_time_local": game.start_time.astimezone(tz).isoformat()}
+        )
+        for game in games
+    ]
+
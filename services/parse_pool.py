@@ -0,0 +1,108 @@
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from core.config import PARSE_POOL_WORKERS
+
+# Parsed entries (Games or EventRanges) cross the process boundary as
+# (model class, field values in model_fields order)
+EntryRecord = Tuple[Type[BaseModel], Tuple[Any, ...]]
+
+_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def pool_size() -> int:
+    """How many parse workers this host gets (0 = parse in-process)."""
+    if PARSE_POOL_WORKERS != "auto":
+        return max(int(PARSE_POOL_WORKERS), 0)
+    # Leave a core for the serving process; a single-core host gains nothing
+    return min(max((os.cpu_count() or 1) - 1, 0), 4)
+
+
+def _init_worker() -> None:
+    from core.logging_config import setup_logging
+
+    setup_logging()
+
+
+def _warm_up() -> int:
+    """Pays the bs4 / lxml import cost before the first real parse."""
+    from bs4 import BeautifulSoup
+
+    BeautifulSoup("<table class='basic'><tr><td></td></tr></table>", "lxml")
+    return os.getpid()
+
+
+def _parse_to_records(
+    parse: Callable[[bytes, int], List[BaseModel]], body: bytes, year: int
+) -> List[EntryRecord]:
+    """Runs in a worker: parse, then flatten the entries for the trip back."""
+    return [
+        (
+            type(entry),
+            tuple(getattr(entry, field) for field in type(entry).model_fields),
+        )
+        for entry in parse(body, year)
+    ]
+
+
+def _from_records(records: List[EntryRecord]) -> List[BaseModel]:
+    # Already validated in the worker, so skip validation here
+    return [
+        model.model_construct(**dict(zip(model.model_fields, values)))
+        for model, values in records
+    ]
+
+
+def start_parse_pool() -> None:
+    """Starts the pool (if this host gets one) and warms every worker."""
+    global _POOL
+    workers = pool_size()
+    if _POOL is not None or workers == 0:
+        return
+    # spawn, not fork: the serving process has threads (log writer, executors)
+    _POOL = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+    )
+    for _ in range(workers):
+        _POOL.submit(_warm_up).add_done_callback(_log_warm_up)
+    logging.info(f"PARSE POOL: Started {workers} parse worker processes.")
+
+
+def _log_warm_up(future: Future) -> None:
+    if future.exception() is not None:
+        logging.error(f"PARSE POOL: Worker warm-up failed: {future.exception()}")
+
+
+def stop_parse_pool() -> None:
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(wait=False, cancel_futures=True)
+        _POOL = None
+
+
+def run_parse(
+    parse: Callable[[bytes, int], List[BaseModel]], body: bytes, year: int
+) -> List[BaseModel]:
+    """
+    Runs `parse(body, year)` on the parse pool, or inline when there is no
+    pool (or it has broken). `parse` must be a module-level function.
+    """
+    global _POOL
+    pool = _POOL
+    if pool is None:
+        return parse(body, year)
+    try:
+        return _from_records(pool.submit(_parse_to_records, parse, body, year).result())
+    except BrokenProcessPool as e:
+        logging.error(f"PARSE POOL: Pool is broken ({e}); parsing in-process.")
+        if _POOL is pool:
+            _POOL = None
+        return parse(body, year)
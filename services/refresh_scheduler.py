@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import random
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# After a failure, retry after RETRY_BASE, doubling per consecutive failure
+RETRY_BASE = timedelta(minutes=1)
+
+
+@dataclass
+class RefreshJob:
+    name: str
+    func: Callable[[], Any]
+    interval: timedelta
+    jitter: float
+    next_run: float  # time.monotonic() deadline
+    last_run: Optional[datetime] = None
+    last_success: Optional[datetime] = None
+    last_error: Optional[str] = None
+    last_duration_s: Optional[float] = None
+    consecutive_failures: int = 0
+    running: bool = False
+
+
+class RefreshScheduler:
+    """
+    Runs blocking refresh jobs (scrapes) on a timer, off the event loop.
+
+    Each job re-runs every `interval` +/- `jitter` (a fraction of the
+    interval), so jobs that started together drift apart instead of
+    bursting upstream at the same moment. A failing job backs off
+    exponentially (RETRY_BASE * 2^n, capped at `max_backoff`). Jobs run
+    one at a time on `executor` (default: the loop's default executor).
+    """
+
+    def __init__(
+        self,
+        max_backoff: timedelta = timedelta(hours=1),
+        executor: Optional[Executor] = None,
+    ):
+        self._jobs: Dict[str, RefreshJob] = {}
+        self._executor = executor
+        self._max_backoff = max_backoff
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def add_job(
+        self,
+        name: str,
+        func: Callable[[], Any],
+        interval: timedelta,
+        jitter: float = 0.1,
+        initial_delay: float = 0.0,
+    ) -> None:
+        self._jobs[name] = RefreshJob(
+            name=name,
+            func=func,
+            interval=interval,
+            jitter=jitter,
+            next_run=time.monotonic() + max(initial_delay, 0.0),
+        )
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _jittered(self, seconds: float, jitter: float) -> float:
+        return seconds * random.uniform(1 - jitter, 1 + jitter)
+
+    def _schedule_next(self, job: RefreshJob, succeeded: bool) -> None:
+        if succeeded:
+            job.consecutive_failures = 0
+            delay = self._jittered(job.interval.total_seconds(), job.jitter)
+        else:
+            job.consecutive_failures += 1
+            backoff = RETRY_BASE.total_seconds() * 2 ** (job.consecutive_failures - 1)
+            delay = self._jittered(
+                min(backoff, self._max_backoff.total_seconds()), job.jitter
+            )
+        job.next_run = time.monotonic() + delay
+
+    async def _run_job(self, job: RefreshJob) -> None:
+        job.running = True
+        job.last_run = datetime.now()
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, job.func)
+        except Exception as e:
+            job.last_error = f"{type(e).__name__}: {e}"
+            logger.error(f"REFRESH: Job {job.name} failed: {job.last_error}")
+            self._schedule_next(job, succeeded=False)
+        else:
+            job.last_success = datetime.now()
+            job.last_error = None
+            self._schedule_next(job, succeeded=True)
+        finally:
+            job.running = False
+            job.last_duration_s = round(time.perf_counter() - started, 3)
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            if not self._jobs:
+                await self._wakeup.wait()
+                continue
+
+            job = min(self._jobs.values(), key=lambda j: j.next_run)
+            delay = job.next_run - time.monotonic()
+            if delay > 0:
+                try:
+                    # Wake early if a job is added while we sleep
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self._run_job(job)
+
+    async def start(self) -> None:
+        global _ACTIVE_SCHEDULER
+        if self.is_running:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="refresh-scheduler")
+        _ACTIVE_SCHEDULER = self
+        logger.info(f"REFRESH: Scheduler started with {len(self._jobs)} jobs.")
+
+    async def stop(self) -> None:
+        global _ACTIVE_SCHEDULER
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if _ACTIVE_SCHEDULER is self:
+            _ACTIVE_SCHEDULER = None
+
+    def status(self) -> List[Dict[str, Any]]:
+        """The next-run table, soonest first."""
+        now_mono, now = time.monotonic(), datetime.now()
+        return [
+            {
+                "name": job.name,
+                "next_run": (
+                    now + timedelta(seconds=job.next_run - now_mono)
+                ).isoformat(),
+                "seconds_until_next_run": round(max(job.next_run - now_mono, 0.0), 1),
+                "interval_seconds": job.interval.total_seconds(),
+                "running": job.running,
+                "last_run": job.last_run.isoformat() if job.last_run else None,
+                "last_success": (
+                    job.last_success.isoformat() if job.last_success else None
+                ),
+                "last_duration_s": job.last_duration_s,
+                "last_error": job.last_error,
+                "consecutive_failures": job.consecutive_failures,
+            }
+            for job in sorted(self._jobs.values(), key=lambda j: j.next_run)
+        ]
+
+
+_ACTIVE_SCHEDULER: Optional[RefreshScheduler] = None
+
+
+def get_active_scheduler() -> Optional[RefreshScheduler]:
+    """The scheduler running in this process, if any."""
+    scheduler = _ACTIVE_SCHEDULER
+    return scheduler if scheduler is not None and scheduler.is_running else None
@@ -0,0 +1,207 @@
+import heapq
+import unicodedata
+import re
+from bisect import bisect_left
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from models.game import EventRange, Game as PydanticGame
+from services.event_ranges import ScheduleEntry, expand_entries, last_start
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Ranking: an exact word beats a prefix, which beats a one-typo match
+EXACT_SCORE = 2.0
+PREFIX_SCORE = 1.0
+FUZZY_SCORE = 0.5
+
+# Shorter words are matched as prefixes only; one typo in two letters is noise
+FUZZY_MIN_LENGTH = 3
+
+# Query words past this many are ignored (names and venues are short)
+MAX_QUERY_WORDS = 6
+
+
+def _normalize(text: str) -> str:
+    """Lower-cases and strips accents, so 'Zürich' matches 'zurich'."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def _tokenize(text: str) -> List[str]:
+    return _TOKEN_RE.findall(_normalize(text))
+
+
+def _searchable_text(entry: ScheduleEntry) -> Tuple[Optional[str], ...]:
+    if isinstance(entry, EventRange):
+        # Its days are named "<name> - Stage N"
+        return (entry.name, entry.venue, "Stage" if entry.stage_count > 1 else None)
+    return (entry.home_team, entry.venue)
+
+
+def _deletions(word: str) -> Set[str]:
+    """The word itself and every way to delete one letter from it."""
+    return {word, *(word[:i] + word[i + 1 :] for i in range(len(word)))}
+
+
+def _within_one_edit(a: str, b: str) -> bool:
+    """True if one substitution, insertion, deletion or swap of two
+    neighbouring letters turns a into b (or they are equal)."""
+    if a == b:
+        return True
+    if abs(len(a) - len(b)) > 1:
+        return False
+    i = 0
+    while i < min(len(a), len(b)) and a[i] == b[i]:
+        i += 1
+    if len(a) == len(b):
+        if a[i + 1 :] == b[i + 1 :]:
+            return True
+        swapped = i + 1 < len(a) and a[i] == b[i + 1] and a[i + 1] == b[i]
+        return swapped and a[i + 2 :] == b[i + 2 :]
+    if len(a) > len(b):
+        return a[i + 1 :] == b[i:]
+    return a[i:] == b[i + 1 :]
+
+
+class EventSearchIndex:
+    """
+    An in-memory autocomplete index over event names and venues.
+
+    It is built once per schedule refresh, over the schedule's entries: a
+    multi-day race is indexed once, and only the races a query returns
+    are expanded into their days. Every token keeps a posting list of
+    entry indices in start-time order; a query scores the entries listed
+    under the tokens each word matches and keeps those every word matched.
+    Typos are looked up in an index of one-letter deletions, so a
+    swapped, missing or extra letter still matches, without scanning the
+    vocabulary.
+    """
+
+    def __init__(self, entries: Iterable[ScheduleEntry]):
+        # Posting lists are ordered by index, so keep the entries by start time
+        self._entries: List[ScheduleEntry] = sorted(entries, key=lambda e: e.start_time)
+
+        postings: Dict[str, List[int]] = {}
+        for i, entry in enumerate(self._entries):
+            for field in _searchable_text(entry):
+                for token in _tokenize(field or ""):
+                    ids = postings.setdefault(token, [])
+                    if not ids or ids[-1] != i:
+                        ids.append(i)
+
+        # Sorted vocabulary + aligned postings = a flattened prefix trie.
+        self._tokens: List[str] = sorted(postings)
+        self._postings: List[List[int]] = [postings[t] for t in self._tokens]
+
+        # Every prefix of every token (of at least FUZZY_MIN_LENGTH - 1
+        # letters), and each of them with one letter deleted. Two strings
+        # within one edit of each other share at least one of these keys.
+        self._deletions: Dict[str, Set[int]] = {}
+        for token_id, token in enumerate(self._tokens):
+            for length in range(FUZZY_MIN_LENGTH - 1, len(token) + 1):
+                for key in _deletions(token[:length]):
+                    self._deletions.setdefault(key, set()).add(token_id)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _prefix_matches(self, word: str) -> Dict[int, float]:
+        matches = {}
+        i = bisect_left(self._tokens, word)
+        while i < len(self._tokens) and self._tokens[i].startswith(word):
+            # An exact word match ranks above a prefix match.
+            matches[i] = EXACT_SCORE if self._tokens[i] == word else PREFIX_SCORE
+            i += 1
+        return matches
+
+    def _fuzzy_matches(self, word: str) -> Dict[int, float]:
+        if len(word) < FUZZY_MIN_LENGTH:
+            return {}
+        candidates: Set[int] = set()
+        for key in _deletions(word):
+            candidates.update(self._deletions.get(key, ()))
+
+        matches = {}
+        for token_id in candidates:
+            token = self._tokens[token_id]
+            # The word may be a misspelled whole token or a misspelled
+            # prefix; only a whole token may be shorter than the word.
+            if any(
+                _within_one_edit(word, token[:length])
+                for length in (len(word) - 1, len(word), len(word) + 1)
+                if length <= len(token)
+                and (length >= len(word) or token == token[:length])
+            ):
+                matches[token_id] = FUZZY_SCORE
+        return matches
+
+    def _word_matches(self, word: str) -> Dict[int, float]:
+        """Token id -> score for every token a query word matches."""
+        matches = self._fuzzy_matches(word)
+        matches.update(self._prefix_matches(word))
+        return matches
+
+    def _entry_scores(self, word: str) -> Dict[int, float]:
+        """Entry index -> the score of the best token a query word matches in it."""
+        scores: Dict[int, float] = {}
+        for token_id, score in self._word_matches(word).items():
+            for i in self._postings[token_id]:
+                if scores.get(i, 0.0) < score:
+                    scores[i] = score
+        return scores
+
+    def _earliest_games(
+        self, indices: Set[int], limit: int, not_before: Optional[datetime]
+    ) -> List[PydanticGame]:
+        """The first `limit` games (by start time) of the given entries."""
+        games: List[PydanticGame] = []
+        # Pop entries in index (= start) order; most queries stop after a few
+        heap = list(indices)
+        heapq.heapify(heap)
+        while heap:
+            entry = self._entries[heapq.heappop(heap)]
+            # Entries are in start order: none after this one can start earlier
+            if len(games) >= limit and entry.start_time > games[limit - 1].start_time:
+                break
+            if not_before is not None and last_start(entry) < not_before:
+                continue
+            games.extend(expand_entries([entry], start=not_before))
+            games.sort(key=lambda game: game.start_time)
+        return games[:limit]
+
+    def search(
+        self, query: str, limit: int = 10, not_before: Optional[datetime] = None
+    ) -> List[PydanticGame]:
+        """
+        Returns games matching every word of the query, best match first,
+        then earliest first. Each word may be a prefix or a slightly
+        misspelled word. Games starting before `not_before` are skipped.
+        """
+        # A repeated word matches nothing new; dict.fromkeys keeps the order
+        words = list(dict.fromkeys(_tokenize(query)))[:MAX_QUERY_WORDS]
+        if not words:
+            return []
+
+        # An entry's score is the sum of its best score for each word. Start
+        # from the word with the fewest matches; every later word can only
+        # drop candidates, so the work is linear in the words' matches.
+        word_scores = sorted((self._entry_scores(word) for word in words), key=len)
+        totals = dict(word_scores[0])
+        for scores in word_scores[1:]:
+            totals = {i: t + scores[i] for i, t in totals.items() if i in scores}
+            if not totals:
+                return []
+
+        by_score: Dict[float, Set[int]] = {}
+        for i, total in totals.items():
+            by_score.setdefault(total, set()).add(i)
+
+        games: List[PydanticGame] = []
+        for total in sorted(by_score, reverse=True):
+            games.extend(
+                self._earliest_games(by_score[total], limit - len(games), not_before)
+            )
+            if len(games) >= limit:
+                break
+        return games
@@ -0,0 +1,106 @@
+import logging
+import os
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator, List, Optional, Tuple
+
+from pydantic import BaseModel, ValidationError
+
+from models.game import EventRange, Game as PydanticGame
+from services.event_ranges import ScheduleEntry
+
+try:
+    import fcntl
+except ImportError:
+    # No flock (Windows): only the single-process dev server runs there
+    fcntl = None
+
+
+class ScheduleSnapshot(BaseModel):
+    timestamp: datetime
+    # Single events; multi-day events are stored once each under `ranges`
+    items: List[PydanticGame]
+    ranges: List[EventRange] = []
+    # The schedule version and its content hash (see schedule_hash), so the
+    # next process to save knows which version comes after this one
+    version: int = 0
+    content_hash: str = ""
+
+
+def save_snapshot(
+    path: str,
+    timestamp: datetime,
+    entries: List[ScheduleEntry],
+    version: int = 0,
+    content_hash: str = "",
+) -> None:
+    """Writes the schedule atomically, so a crash never leaves a half-written file."""
+    snapshot = ScheduleSnapshot(
+        timestamp=timestamp,
+        items=[e for e in entries if isinstance(e, PydanticGame)],
+        ranges=[e for e in entries if isinstance(e, EventRange)],
+        version=version,
+        content_hash=content_hash,
+    )
+    directory = os.path.dirname(path) or "."
+    tmp_path = None
+    try:
+        os.makedirs(directory, exist_ok=True)
+        # A temp file of our own (in the same directory, so os.replace stays
+        # atomic): processes saving at once never write into each other's.
+        fd, tmp_path = tempfile.mkstemp(
+            dir=directory, prefix=f"{os.path.basename(path)}.", suffix=".tmp"
+        )
+        with os.fdopen(fd, "wb") as f:
+            f.write(snapshot.model_dump_json().encode("utf-8"))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logging.error(f"SNAPSHOT: Could not write {path}: {e}")
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def load_snapshot(
+    path: str,
+) -> Optional[Tuple[datetime, List[ScheduleEntry], int, str]]:
+    """
+    Returns (timestamp, entries, version, content hash) from the last saved
+    snapshot, if any.
+    """
+    try:
+        with open(path, "rb") as f:
+            snapshot = ScheduleSnapshot.model_validate_json(f.read())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValidationError) as e:
+        logging.error(f"SNAPSHOT: Ignoring unreadable snapshot {path}: {e}")
+        return None
+    entries = [*snapshot.items, *snapshot.ranges]
+    return snapshot.timestamp, entries, snapshot.version, snapshot.content_hash
+
+
+@contextmanager
+def snapshot_lock(path: str) -> Iterator[None]:
+    """
+    Holds an exclusive lock on `{path}.lock` while the block runs, so the
+    processes sharing a snapshot (serve.py workers) refresh it one at a
+    time. If the lock file can't be opened, the block runs unlocked.
+    """
+    if fcntl is None:
+        yield
+        return
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        lock_file = open(f"{path}.lock", "a")
+    except OSError as e:
+        logging.error(f"SNAPSHOT: Could not open the lock for {path}: {e}")
+        yield
+        return
+    # Closing the file releases the lock
+    with lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
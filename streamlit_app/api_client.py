@@ -1,3 +1,4 @@
+import hashlib
 import requests
 import streamlit as st
 import logging
@@ -8,6 +9,9 @@ import logging
 API_URL = st.secrets.get("API_URL", "http://127.0.0.1:8001/api/v1")
 # --- END CHANGE ---
 
+# All times are shown in this zone; the API localizes them for us.
+DISPLAY_TIMEZONE = st.secrets.get("DISPLAY_TIMEZONE", "America/New_York")
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s [%(levelname)s] %(message)s"
@@ -27,8 +31,11 @@ logger = logging.getLogger(__name__)
 
 
 @st.cache_data(ttl=900)  # Cache for 15 minutes
-def get_schedule():
-    """Fetches the public schedule from the API."""
+def get_schedule_snapshot():
+    """
+    Fetches the public schedule from the API.
+    Returns (etag, games), where the etag identifies this exact payload.
+    """
     # --- ✂️ FAT CUT ---
     # Removed token, headers, and 401 handling
     # Changed endpoint from /schedule/me to /schedule
@@ -37,11 +44,16 @@ def get_schedule():
     logger.info("API Client: Fetching public schedule...")
     try:
         # No 'headers' argument needed
-        response = requests.get(schedule_url, timeout=30)
+        response = requests.get(
+            schedule_url, params={"tz": DISPLAY_TIMEZONE}, timeout=30
+        )
 
         if response.status_code == 200:
             logger.info("API Client: Schedule fetched successfully.")
-            return response.json()
+            etag = response.headers.get("ETag") or hashlib.blake2b(
+                response.content, digest_size=16
+            ).hexdigest()
+            return etag, response.json()
         else:
             logger.error(
                 f"API Client: Failed to fetch schedule. Status: {response.status_code}, Response: {response.text[:200]}"
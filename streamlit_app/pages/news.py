@@ -1,8 +1,75 @@
+import heapq
+import html
 import streamlit as st
 from datetime import datetime
 import pytz
 
-from api_client import get_news, get_all_leagues
+from api_client import get_news, get_all_leagues, DISPLAY_TIMEZONE
+
+# Build the tz object once, not once per article
+DISPLAY_TZ = pytz.timezone(DISPLAY_TIMEZONE)
+
+# Articles are shown in batches; each batch is a single HTML block
+NEWS_BATCH_SIZE = 20
+NEWS_SESSION_KEYS = ("news_data", "news_leagues", "news_cards", "news_index")
+
+
+def _render_card(item: dict) -> str:
+    """Pre-renders one article card (done once per fetch, not per rerun)."""
+    try:
+        pub_date_utc = datetime.fromisoformat(
+            item["published_date"].replace("Z", "+00:00")
+        )
+        pub_date_local = pub_date_utc.astimezone(DISPLAY_TZ)
+        return f"""
+        <div class="news-card">
+            <div class="news-title">
+                <a href="{html.escape(item['url'])}" target="_blank">{html.escape(item['title'])}</a>
+            </div>
+            <div class="news-caption">
+                {html.escape(item['source'])} &bull; {pub_date_local.strftime('%b %d, %Y, %-I:%M %p %Z')}
+            </div>
+            <p class="news-summary">{item.get('summary') or 'No summary available.'}...</p>
+        </div>
+        """
+    except (ValueError, TypeError, KeyError, AttributeError):
+        return f"""
+        <div class="news-card">
+            <div class="news-title">
+                <a href="{html.escape(str(item.get('url', '#')))}" target="_blank">{html.escape(str(item.get('title', 'Untitled')))}</a>
+            </div>
+            <div class="news-caption">
+                Source: {html.escape(str(item.get('source', 'Unknown')))} | Published: {html.escape(str(item.get('published_date', 'Unknown')))}
+            </div>
+        </div>
+        """
+
+
+def _build_news_index(items: list):
+    """
+    Pre-renders one card per article URL and builds a source -> [card
+    positions] index. An article listed under several sources is in each
+    of their lists, so filtering to any one of them still shows it.
+    Positions are in newest-first order, so merging the lists for the
+    selected sources keeps that order.
+    """
+    cards, index, positions = [], {}, {}
+    for item in items:
+        url = item.get("url")
+        if url not in positions:
+            positions[url] = len(cards)
+            cards.append(_render_card(item))
+        index.setdefault(item.get("source"), set()).add(positions[url])
+    return cards, {source: sorted(found) for source, found in index.items()}
+
+
+def _merge_positions(lists) -> list:
+    """Merges sorted position lists, dropping articles shared by sources."""
+    merged = []
+    for position in heapq.merge(*lists):
+        if not merged or merged[-1] != position:
+            merged.append(position)
+    return merged
 
 # 1. Updated Browser Tab Title
 st.set_page_config(page_title="The Aggregate - News", page_icon="📰")
@@ -13,10 +80,9 @@ st.subheader("📰 News")
 
 # --- Session Caching Logic (Part 1) ---
 if st.button("Refresh News"):
-    if "news_data" in st.session_state:
-        del st.session_state["news_data"]
-    if "news_leagues" in st.session_state:
-        del st.session_state["news_leagues"]
+    for key in NEWS_SESSION_KEYS:
+        if key in st.session_state:
+            del st.session_state[key]
     st.rerun()
 
 # --- Custom CSS (Unchanged) ---
@@ -54,6 +120,8 @@ if "news_data" not in st.session_state:
         if not all_available_leagues:
             st.session_state["news_data"] = []
             st.session_state["news_leagues"] = []
+            st.session_state["news_cards"] = []
+            st.session_state["news_index"] = {}
         else:
             leagues_to_fetch_news_for = set()
             cycling_leagues = {"Cycling - World Tour", "Cycling - Pro Series"}
@@ -79,6 +147,10 @@ if "news_data" not in st.session_state:
             # Store results in the session
             st.session_state["news_data"] = all_news_items
             st.session_state["news_leagues"] = sorted(list(leagues_to_fetch_news_for))
+            (
+                st.session_state["news_cards"],
+                st.session_state["news_index"],
+            ) = _build_news_index(all_news_items)
 
 
 # --- Read from the Session Cache (This is fast) ---
@@ -92,9 +164,6 @@ else:
         "Filter news by league:", options=league_options, default=league_options
     )
 
-    final_filtered_items = []
-    seen_urls = set()
-
     # Create a set of all the sources we want to show
     selected_sources = set(selected_leagues)
 
@@ -104,46 +173,29 @@ else:
         selected_sources.add("Cycling - World Tour")
         selected_sources.add("Cycling - Pro Series")
 
-    for item in all_items_from_cache:
-        if item["url"] in seen_urls:
-            continue
+    news_cards = st.session_state.get("news_cards", [])
+    news_index = st.session_state.get("news_index", {})
+    filtered_positions = _merge_positions(
+        news_index.get(source, []) for source in selected_sources
+    )
 
-        # This is the new, simple check.
-        # If the item's source is in our set, add it.
-        if item["source"] in selected_sources:
-            final_filtered_items.append(item)
-            seen_urls.add(item["url"])
+    # Start from the first batch again whenever the filter changes
+    filter_key = tuple(sorted(selected_sources))
+    if st.session_state.get("news_filter_key") != filter_key:
+        st.session_state["news_filter_key"] = filter_key
+        st.session_state["news_visible"] = NEWS_BATCH_SIZE
 
     st.divider()
 
-    if not final_filtered_items:
+    if not filtered_positions:
         st.info("No news articles found for your selected leagues.")
 
-    for item in final_filtered_items[:50]:
-        try:
-            pub_date_utc = datetime.fromisoformat(
-                item["published_date"].replace("Z", "+00:00")
-            )
-            pub_date_local = pub_date_utc.astimezone(pytz.timezone("America/New_York"))
-
-            st.html(
-                f"""
-            <div class="news-card">
-                <div class="news-title">
-                    <a href="{item['url']}" target="_blank">{item['title']}</a>
-                </div>
-                <div class="news-caption">
-                    {item['source']} &bull; {pub_date_local.strftime('%b %d, %Y, %-I:%M %p %Z')}
-                </div>
-                <p class="news-summary">{item.get('summary', 'No summary available.')}...</p>
-            </div>
-            """
-            )
-        except (ValueError, TypeError, KeyError):
-            st.markdown(
-                f"**[{item.get('title', 'Untitled')}]({item.get('url', '#')})**"
-            )
-            st.caption(
-                f"Source: {item.get('source', 'Unknown')} | Published: {item.get('published_date', 'Unknown')}"
-            )
-            st.divider()
+    visible = min(st.session_state["news_visible"], len(filtered_positions))
+    for batch_start in range(0, visible, NEWS_BATCH_SIZE):
+        batch = filtered_positions[batch_start : min(batch_start + NEWS_BATCH_SIZE, visible)]
+        st.html("".join(news_cards[i] for i in batch))
+
+    if visible < len(filtered_positions):
+        if st.button(f"Load more ({len(filtered_positions) - visible} remaining)"):
+            st.session_state["news_visible"] += NEWS_BATCH_SIZE
+            st.rerun()
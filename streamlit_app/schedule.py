@@ -1,7 +1,8 @@
 import streamlit as st
 from datetime import datetime, timedelta
 
-from api_client import get_schedule, get_all_leagues
+from api_client import get_schedule_snapshot, get_all_leagues
+from schedule_view import BUSY_DAY_THRESHOLD, build_schedule_view
 
 # 1. Updated Browser Tab Title
 st.set_page_config(page_title="The Aggregate", page_icon="🗓️", layout="wide")
@@ -27,6 +28,11 @@ st.markdown(
     .score { font-size: 1.3em; font-weight: bold; letter-spacing: 1px; }
     .status-final { font-weight: bold; color: #8A8D93; }
     [data-theme="light"] .status-final { color: #4F4F4F; }
+    .schedule-table { width: 100%; border-collapse: collapse; }
+    .schedule-table th, .schedule-table td {
+        padding: 6px 10px; border-bottom: 1px solid rgba(128, 128, 128, 0.3);
+        text-align: left;
+    }
 </style>
 """,
     unsafe_allow_html=True,
@@ -37,7 +43,8 @@ st.title("The Aggregate")
 st.subheader("🗓️ Schedule")
 
 # --- Fetch Public Data (No Token) ---
-schedule_data = get_schedule()
+schedule_snapshot = get_schedule_snapshot()
+schedule_data = schedule_snapshot[1] if schedule_snapshot else None
 all_league_names = get_all_leagues()
 
 # --- Setup Sidebar Filter ---
@@ -75,46 +82,34 @@ with date_col4:
         st.rerun()
 st.divider()
 
-# --- Main Schedule Display Logic (Unchanged) ---
+# --- Main Schedule Display Logic ---
 if schedule_data:
-    filtered_by_league = []
-    if selected_league == "All Sports":
-        filtered_by_league = schedule_data
-    else:
-        filtered_by_league = [
-            game for game in schedule_data if game.get("league") == selected_league
-        ]
+    # Built once per payload (keyed on its ETag); day switches are lookups.
+    schedule_view = build_schedule_view(*schedule_snapshot)
 
-    final_schedule = []
     current_date = st.session_state.schedule_date
-    for game in filtered_by_league:
-        utc_string = game["start_time"].replace("Z", "+00:00")
-        utc_time = datetime.fromisoformat(utc_string)
-        local_time = utc_time.astimezone()  # Uses local timezone
-        if local_time.date() == current_date:
-            final_schedule.append(game)
+    day_rows = schedule_view.rows_for(
+        current_date.isoformat(),
+        None if selected_league == "All Sports" else selected_league,
+    )
 
     st.header(
         f"Schedule for {selected_league} - {current_date.strftime('%a, %b %d, %Y')}"
     )
 
-    if not final_schedule:
+    if not day_rows:
         st.info(f"No upcoming games found for '{selected_league}' on this date.")
 
     LIVE_STATES = {"STATUS_IN_PROGRESS", "STATUS_HALFTIME"}
     FINAL_STATES = {"STATUS_FINAL", "STATUS_FULL_TIME"}
 
-    for game in final_schedule:
-        with st.container(border=True):
-            is_team_sport = game.get("away_team") and game.get("away_team") != "TBD"
-            game_status = game.get("status", "STATUS_SCHEDULED")
-
-            if is_team_sport:
-                # (Team sport logic is unchanged)
-                col1, col2, col3, col4 = st.columns([2, 1, 2, 3])
-                # ...
-            else:
-                # (Niche sport logic is unchanged)
+    if len(day_rows) > BUSY_DAY_THRESHOLD:
+        # Busy day: one HTML block instead of several widgets per game
+        st.html(schedule_view.table_html(day_rows))
+    else:
+        for i in day_rows:
+            game = schedule_view.row(i)
+            with st.container(border=True):
                 col1, col2 = st.columns([4, 3])
                 with col1:
                     st.markdown(
@@ -122,26 +117,26 @@ if schedule_data:
                         unsafe_allow_html=True,
                     )
                 with col2:
-                    if game_status in LIVE_STATES:
+                    if game["status"] in LIVE_STATES:
                         st.markdown(
                             '<div class="live-badge">LIVE</div>',
                             unsafe_allow_html=True,
                         )
-                    elif game_status in FINAL_STATES:
+                    elif game["status"] in FINAL_STATES:
                         st.markdown(
                             '<div class="status-final">Final</div>',
                             unsafe_allow_html=True,
                         )
                     else:
                         st.write("**Time (Local)**")
-                        st.write(game["start_time_local"])
-
-            with st.expander("More Info"):
-                st.write(f"**Status:** {game['status']}")
-                st.write(f"**Venue:** {game.get('venue', 'N/A')}")
-                st.write(f"**League:** {game.get('league', 'N/A')}")
-                if game.get("official_url"):
-                    st.markdown(f"[View on source]({game['official_url']})")
+                        st.write(game["local_time"])
+
+                with st.expander("More Info"):
+                    st.write(f"**Status:** {game['status']}")
+                    st.write(f"**Venue:** {game['venue']}")
+                    st.write(f"**League:** {game['league']}")
+                    if game["official_url"]:
+                        st.markdown(f"[View on source]({game['official_url']})")
 else:
     if schedule_data is None:
         st.error(
@@ -0,0 +1,105 @@
+import html
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import streamlit as st
+
+# Days with more games than this render as one HTML table, not per-game widgets
+BUSY_DAY_THRESHOLD = 12
+
+COLUMNS = (
+    "game_id",
+    "league",
+    "home_team",
+    "status",
+    "venue",
+    "official_url",
+    "local_date",
+    "local_time",
+)
+
+
+@dataclass
+class ScheduleView:
+    """
+    A columnar, pre-indexed copy of one schedule payload.
+
+    Every column is a list aligned by row number, and the indexes map a
+    local date (and optionally a league) to row numbers, so switching days
+    is a dict lookup instead of a scan over every game.
+    """
+
+    columns: Dict[str, list] = field(default_factory=dict)
+    by_day: Dict[str, List[int]] = field(default_factory=dict)
+    by_day_league: Dict[Tuple[str, str], List[int]] = field(default_factory=dict)
+    row_html: List[str] = field(default_factory=list)
+
+    def rows_for(self, day: str, league: Optional[str] = None) -> List[int]:
+        if league is None:
+            return self.by_day.get(day, [])
+        return self.by_day_league.get((day, league), [])
+
+    def row(self, i: int) -> Dict[str, str]:
+        return {name: self.columns[name][i] for name in COLUMNS}
+
+    def table_html(self, rows: List[int]) -> str:
+        """One HTML block for a busy day, built from pre-rendered rows."""
+        return (
+            "<table class='schedule-table'><thead><tr>"
+            "<th>Time</th><th>Event</th><th>League</th><th>Venue</th><th></th>"
+            "</tr></thead><tbody>"
+            + "".join(self.row_html[i] for i in rows)
+            + "</tbody></table>"
+        )
+
+
+def _row_html(row: Dict[str, str]) -> str:
+    link = (
+        f"<a href='{html.escape(row['official_url'])}' target='_blank'>Source</a>"
+        if row["official_url"]
+        else ""
+    )
+    return (
+        "<tr>"
+        f"<td>{html.escape(row['local_time'])}</td>"
+        f"<td class='event-name'>{html.escape(row['home_team'])}</td>"
+        f"<td>{html.escape(row['league'])}</td>"
+        f"<td>{html.escape(row['venue'])}</td>"
+        f"<td>{link}</td>"
+        "</tr>"
+    )
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def build_schedule_view(etag: str, _payload: List[dict]) -> ScheduleView:
+    """
+    Builds the view model once per fetched payload. The cache is keyed on the
+    payload's ETag only (the leading underscore tells Streamlit not to hash
+    the payload itself on every rerun).
+    """
+    view = ScheduleView(columns={name: [] for name in COLUMNS})
+
+    for i, game in enumerate(_payload):
+        # 'start_time_local' is already in DISPLAY_TIMEZONE (see api_client)
+        local_iso = game.get("start_time_local") or game["start_time"]
+        local_dt = datetime.fromisoformat(local_iso.replace("Z", "+00:00"))
+
+        row = {
+            "game_id": game["game_id"],
+            "league": game.get("league") or "N/A",
+            "home_team": game["home_team"],
+            "status": game.get("status") or "STATUS_SCHEDULED",
+            "venue": game.get("venue") or "N/A",
+            "official_url": game.get("official_url") or "",
+            "local_date": local_iso[:10],
+            "local_time": local_dt.strftime("%-I:%M %p"),
+        }
+        for name in COLUMNS:
+            view.columns[name].append(row[name])
+        view.row_html.append(_row_html(row))
+
+        view.by_day.setdefault(row["local_date"], []).append(i)
+        view.by_day_league.setdefault((row["local_date"], row["league"]), []).append(i)
+
+    return view